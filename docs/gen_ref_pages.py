@@ -1,5 +1,8 @@
 """Generate the API reference pages."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
 import mkdocs_gen_files
 
 # Map of module paths to their corresponding documentation files
@@ -9,13 +12,20 @@ MODULE_DOCS_MAP = {
     "narrative.llm.llm_renderer": "api/llm-bridge.md",
 }
 
-# Generate the API reference pages
-for module_path, doc_path in MODULE_DOCS_MAP.items():
+
+def _emit_page(item: Tuple[str, str]) -> None:
+    """Write the reference page for a single module."""
+    module_path, doc_path = item
+    title = module_path.rsplit(".", 1)[-1].replace("_", " ").title()
     with mkdocs_gen_files.open(doc_path, "w") as f:
-        print(f"# {module_path.split('.')[-1].replace('_', ' ').title()}", file=f)
-        print(file=f)
-        print(f":::{module_path}", file=f)
-        print(file=f)
+        f.write(f"# {title}\n\n:::{module_path}\n\n")
+
+
+# Generate the API reference pages; each page has its own target file, so
+# they can be written concurrently
+with ThreadPoolExecutor(max_workers=min(8, len(MODULE_DOCS_MAP))) as executor:
+    # Consume the results so that any exception is raised here
+    list(executor.map(_emit_page, MODULE_DOCS_MAP.items()))
 
 # Create the .pages file to customize the section title
 with mkdocs_gen_files.open("api/.pages", "w") as f:
@@ -1,13 +1,13 @@
 import warnings
 from typing import Any
 
-# Suppress specific deprecation warnings
+# Suppress the autorefs `span` element deprecation warnings. These are raised
+# from inside mkdocs_autorefs itself, so match on the module name rather than
+# regex-matching the message of every warning emitted during the build.
 warnings.filterwarnings(
     "ignore",
-    message=(
-        "autorefs `span` elements are deprecated in favor of " "`autoref` elements"
-    ),
     category=DeprecationWarning,
+    module="mkdocs_autorefs",
 )
 
 
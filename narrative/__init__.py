@@ -9,18 +9,55 @@ and rendering those trajectories into natural language stories using LLMs.
 
 __version__ = "0.2.1"
 
-from narrative.core.idg_builder import IDG, IDGBuilder
-from narrative.core.trajectory_explorer import (
-    CoherenceMetric,
-    DramaMetric,
-    NoveltyMetric,
-    Trajectory,
-    TrajectoryExplorer,
-)
-from narrative.llm.llm_renderer import LLMAdapter, LLMRenderer, MockLLMAdapter
-
-# Import key classes and functions for easy access
-from narrative.schemas.domain import Dependency, Domain, Intention
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from narrative.core.idg_builder import IDG, IDGBuilder
+    from narrative.core.trajectory_explorer import (
+        CoherenceMetric,
+        DramaMetric,
+        NoveltyMetric,
+        Trajectory,
+        TrajectoryExplorer,
+    )
+    from narrative.llm.llm_renderer import LLMAdapter, LLMRenderer, MockLLMAdapter
+    from narrative.schemas.domain import Dependency, Domain, Intention
+
+# Key classes are imported lazily on first access (PEP 562), so that
+# `import narrative` does not load networkx, pydantic, or the LLM bridge
+# until they are actually used
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "Domain": ("narrative.schemas.domain", "Domain"),
+    "Intention": ("narrative.schemas.domain", "Intention"),
+    "Dependency": ("narrative.schemas.domain", "Dependency"),
+    "IDGBuilder": ("narrative.core.idg_builder", "IDGBuilder"),
+    "IDG": ("narrative.core.idg_builder", "IDG"),
+    "TrajectoryExplorer": ("narrative.core.trajectory_explorer", "TrajectoryExplorer"),
+    "Trajectory": ("narrative.core.trajectory_explorer", "Trajectory"),
+    "NoveltyMetric": ("narrative.core.trajectory_explorer", "NoveltyMetric"),
+    "CoherenceMetric": ("narrative.core.trajectory_explorer", "CoherenceMetric"),
+    "DramaMetric": ("narrative.core.trajectory_explorer", "DramaMetric"),
+    "LLMRenderer": ("narrative.llm.llm_renderer", "LLMRenderer"),
+    "LLMAdapter": ("narrative.llm.llm_renderer", "LLMAdapter"),
+    "MockLLMAdapter": ("narrative.llm.llm_renderer", "MockLLMAdapter"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import key classes on first access."""
+    if name in _LAZY:
+        module_path, attr_name = _LAZY[name]
+        value = getattr(importlib.import_module(module_path), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 # Define what's available for import with `from narrative import *`
 __all__ = [
@@ -4,14 +4,45 @@ Core Package
 This package contains the core components of the Narrative library.
 """
 
-from narrative.core.idg_builder import IDG, IDGBuilder
-from narrative.core.trajectory_explorer import (
-    CoherenceMetric,
-    DramaMetric,
-    NoveltyMetric,
-    Trajectory,
-    TrajectoryExplorer,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from narrative.core.idg_builder import IDG, IDGBuilder
+    from narrative.core.trajectory_explorer import (
+        CoherenceMetric,
+        DramaMetric,
+        NoveltyMetric,
+        Trajectory,
+        TrajectoryExplorer,
+    )
+
+# Submodules are imported lazily on first access (PEP 562)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "IDGBuilder": ("narrative.core.idg_builder", "IDGBuilder"),
+    "IDG": ("narrative.core.idg_builder", "IDG"),
+    "TrajectoryExplorer": ("narrative.core.trajectory_explorer", "TrajectoryExplorer"),
+    "Trajectory": ("narrative.core.trajectory_explorer", "Trajectory"),
+    "NoveltyMetric": ("narrative.core.trajectory_explorer", "NoveltyMetric"),
+    "CoherenceMetric": ("narrative.core.trajectory_explorer", "CoherenceMetric"),
+    "DramaMetric": ("narrative.core.trajectory_explorer", "DramaMetric"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import core classes on first access."""
+    if name in _LAZY:
+        module_path, attr_name = _LAZY[name]
+        value = getattr(importlib.import_module(module_path), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "IDGBuilder",
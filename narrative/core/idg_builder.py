@@ -6,13 +6,43 @@ Graph (IDG) from a domain.
 """
 # flake8: noqa: E501
 
-from typing import Any, Dict, List, Set, Tuple
+import sys
+from array import array
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
 import networkx as nx
 
 from narrative.schemas.domain import Dependency, Domain, Intention
 
 
+class CSRAdjacency(NamedTuple):
+    """
+    Compact structure-of-arrays snapshot of an IDG.
+
+    Nodes are numbered by insertion order. The successors of node ``i`` are
+    ``succ_indices[succ_indptr[i]:succ_indptr[i + 1]]`` and its predecessors
+    are laid out the same way in the ``pred_*`` arrays. Node attributes are
+    not included, since editing them in place does not invalidate the
+    snapshot; read them from ``IDG.nodes`` instead.
+
+    Attributes:
+        node_ids: The intention ID of each node, indexed by node number.
+        node_index: A mapping from intention ID to node number.
+        succ_indptr: Offsets into ``succ_indices`` for each node.
+        succ_indices: Successor node numbers, grouped by node.
+        pred_indptr: Offsets into ``pred_indices`` for each node.
+        pred_indices: Predecessor node numbers, grouped by node.
+    """
+
+    node_ids: List[str]
+    node_index: Dict[str, int]
+    succ_indptr: array
+    succ_indices: array
+    pred_indptr: array
+    pred_indices: array
+
+
 class IDG(nx.DiGraph):
     """
     Intention Dependency Graph (IDG) class.
@@ -22,66 +52,254 @@ class IDG(nx.DiGraph):
     networkx.DiGraph to provide additional methods for working with IDGs.
     """
 
+    # matplotlib.pyplot, imported on the first call to visualize()
+    _plt: Any = None
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize an IDG."""
+        # The caches must exist before networkx loads any incoming graph data,
+        # since that goes through the overridden mutation methods below.
+        self._roots: Optional[FrozenSet[str]] = None
+        self._leaves: Optional[FrozenSet[str]] = None
+        self._csr: Optional[CSRAdjacency] = None
         super().__init__(*args, **kwargs)
 
-    def get_root_intentions(self) -> Set[str]:
+    def _invalidate_cache(self) -> None:
+        """Drop the cached root/leaf sets and adjacency after a change."""
+        self._roots = None
+        self._leaves = None
+        self._csr = None
+
+    def _is_view(self) -> bool:
+        """
+        Check whether the IDG is a view of another graph.
+
+        Views such as ``subgraph()`` and ``reverse(copy=False)`` reflect
+        changes to the underlying graph without going through this IDG's
+        mutation methods, so they must not cache anything derived from it.
+
+        Returns:
+            True if the IDG is a graph view.
+        """
+        return hasattr(self, "_graph")
+
+    def add_node(self, node_for_adding: Any, **attr: Any) -> None:
+        """Add a node, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().add_node(node_for_adding, **attr)
+
+    def add_nodes_from(self, nodes_for_adding: Any, **attr: Any) -> None:
+        """Add nodes, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().add_nodes_from(nodes_for_adding, **attr)
+
+    def add_edge(self, u_of_edge: Any, v_of_edge: Any, **attr: Any) -> None:
+        """Add an edge, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def add_edges_from(self, ebunch_to_add: Any, **attr: Any) -> None:
+        """Add edges, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().add_edges_from(ebunch_to_add, **attr)
+
+    def remove_node(self, n: Any) -> None:
+        """Remove a node, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes: Any) -> None:
+        """Remove nodes, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().remove_nodes_from(nodes)
+
+    def remove_edge(self, u: Any, v: Any) -> None:
+        """Remove an edge, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().remove_edge(u, v)
+
+    def remove_edges_from(self, ebunch: Any) -> None:
+        """Remove edges, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().remove_edges_from(ebunch)
+
+    def clear(self) -> None:
+        """Clear the graph, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().clear()
+
+    def clear_edges(self) -> None:
+        """Remove all edges, invalidating the cached sets and CSR snapshot."""
+        self._invalidate_cache()
+        super().clear_edges()
+
+    def get_root_intentions(self) -> FrozenSet[str]:
         """
         Get the root intentions in the IDG.
 
         Root intentions are intentions that are not depended upon by any other
-        intention.
+        intention. The set is computed once and cached until the graph changes,
+        except on graph views, which are recomputed on every call.
 
         Returns:
-            A set of intention IDs that are roots in the IDG.
+            A frozen set of intention IDs that are roots in the IDG.
         """
-        return {node for node in self.nodes if self.in_degree(node) == 0}
-
-    def get_leaf_intentions(self) -> Set[str]:
+        roots = self._roots
+        if roots is None:
+            roots = frozenset(node for node, degree in self.in_degree() if degree == 0)
+            if not self._is_view():
+                self._roots = roots
+        return roots
+
+    def get_leaf_intentions(self) -> FrozenSet[str]:
         """
         Get the leaf intentions in the IDG.
 
         Leaf intentions are intentions that do not depend on any other
-        intention.
+        intention. The set is computed once and cached until the graph changes,
+        except on graph views, which are recomputed on every call.
+
+        Returns:
+            A frozen set of intention IDs that are leaves in the IDG.
+        """
+        leaves = self._leaves
+        if leaves is None:
+            leaves = frozenset(
+                node for node, degree in self.out_degree() if degree == 0
+            )
+            if not self._is_view():
+                self._leaves = leaves
+        return leaves
+
+    def csr(self) -> CSRAdjacency:
+        """
+        Get a compact array representation of the IDG.
+
+        The representation is built on first use and cached until nodes or
+        edges are added or removed. Graph views rebuild it on every call. It
+        is intended for hot traversals that only need node numbers and
+        adjacency, avoiding networkx's nested dictionaries.
+
+        Returns:
+            The CSR adjacency of the IDG.
+        """
+        csr = self._csr
+        if csr is None:
+            node_ids = list(self.nodes)
+            node_index = {node: i for i, node in enumerate(node_ids)}
+
+            succ_indptr = array("i", [0])
+            succ_indices = array("i")
+            pred_indptr = array("i", [0])
+            pred_indices = array("i")
+            for node in node_ids:
+                succ_indices.extend(node_index[v] for v in self.succ[node])
+                succ_indptr.append(len(succ_indices))
+                pred_indices.extend(node_index[u] for u in self.pred[node])
+                pred_indptr.append(len(pred_indices))
+
+            csr = CSRAdjacency(
+                node_ids=node_ids,
+                node_index=node_index,
+                succ_indptr=succ_indptr,
+                succ_indices=succ_indices,
+                pred_indptr=pred_indptr,
+                pred_indices=pred_indices,
+            )
+            if not self._is_view():
+                self._csr = csr
+        return csr
+
+    def finalize(self) -> "IDG":
+        """
+        Freeze the IDG and build its compact array representation.
+
+        After finalizing, any attempt to add or remove nodes or edges raises
+        a ``networkx.NetworkXError``.
+
+        Returns:
+            The IDG itself, for chaining.
+        """
+        self.csr()
+        nx.freeze(self)
+        return self
+
+    def successors_fast(self, intention_id: str) -> array:
+        """
+        Get the successors of an intention as node numbers.
+
+        Args:
+            intention_id: The ID of the intention.
+
+        Returns:
+            An int array of successor node numbers; map them back to
+            intention IDs with ``csr().node_ids``.
+
+        Raises:
+            KeyError: If the intention ID is not in the IDG.
+        """
+        csr = self.csr()
+        i = csr.node_index[intention_id]
+        return csr.succ_indices[csr.succ_indptr[i] : csr.succ_indptr[i + 1]]
+
+    def predecessors_fast(self, intention_id: str) -> array:
+        """
+        Get the predecessors of an intention as node numbers.
+
+        Args:
+            intention_id: The ID of the intention.
 
         Returns:
-            A set of intention IDs that are leaves in the IDG.
+            An int array of predecessor node numbers; map them back to
+            intention IDs with ``csr().node_ids``.
+
+        Raises:
+            KeyError: If the intention ID is not in the IDG.
         """
-        return {node for node in self.nodes if self.out_degree(node) == 0}
+        csr = self.csr()
+        i = csr.node_index[intention_id]
+        return csr.pred_indices[csr.pred_indptr[i] : csr.pred_indptr[i + 1]]
 
-    def get_intention_data(self, intention_id: str) -> Dict[str, Any]:
+    def get_intention_data(self, intention_id: str) -> Mapping[str, Any]:
         """
         Get the data associated with an intention.
 
+        The data is returned as a read-only view of the node's attributes,
+        without copying. Use ``dict(idg.get_intention_data(...))`` if a
+        mutable copy is needed.
+
         Args:
             intention_id: The ID of the intention.
 
         Returns:
-            A dictionary containing the intention data.
+            A read-only mapping containing the intention data.
 
         Raises:
             KeyError: If the intention ID is not in the IDG.
         """
-        return dict(self.nodes[intention_id])
+        return MappingProxyType(self.nodes[intention_id])
 
     def get_dependency_data(
         self, from_intention: str, to_intention: str
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Get the data associated with a dependency.
 
+        The data is returned as a read-only view of the edge's attributes,
+        without copying. Use ``dict(idg.get_dependency_data(...))`` if a
+        mutable copy is needed.
+
         Args:
             from_intention: The ID of the intention that depends on another.
             to_intention: The ID of the intention that is depended upon.
 
         Returns:
-            A dictionary containing the dependency data.
+            A read-only mapping containing the dependency data.
 
         Raises:
             KeyError: If the dependency is not in the IDG.
         """
-        return dict(self.edges[from_intention, to_intention])
+        return MappingProxyType(self.edges[from_intention, to_intention])
 
     def visualize(
         self,
@@ -92,6 +310,7 @@ class IDG(nx.DiGraph):
         edge_color: str = "black",
         node_color: str = "lightblue",
         with_labels: bool = True,
+        layout: str = "spring",
     ) -> None:
         """
         Visualize the IDG using matplotlib.
@@ -104,20 +323,29 @@ class IDG(nx.DiGraph):
             edge_color: The color of the edges.
             node_color: The color of the nodes.
             with_labels: Whether to display node labels.
+            layout: The node layout to use. ``"spring"`` uses a force-directed
+                layout, ``"layered"`` places nodes in topological layers,
+                and ``"dot"`` uses Graphviz (falling back to ``"layered"``
+                if pygraphviz is not installed). The layered layouts are much
+                faster than ``"spring"`` for large IDGs.
 
         Raises:
             ImportError: If matplotlib is not installed.
+            ValueError: If the layout name is not recognized.
         """
-        try:
-            import matplotlib.pyplot as plt
-        except ImportError as err:
-            raise ImportError(
-                "Matplotlib is required for visualization. "
-                "Install it with 'pip install matplotlib'."
-            ) from err
-
+        if IDG._plt is None:
+            try:
+                import matplotlib.pyplot as plt
+            except ImportError as err:
+                raise ImportError(
+                    "Matplotlib is required for visualization. "
+                    "Install it with 'pip install matplotlib'."
+                ) from err
+            IDG._plt = plt
+        plt = IDG._plt
+
+        pos = self._layout_positions(layout)
         plt.figure(figsize=figsize)
-        pos = nx.spring_layout(self, seed=42)
         nx.draw(
             self,
             pos,
@@ -130,13 +358,78 @@ class IDG(nx.DiGraph):
         )
 
         # Add edge labels for dependency types
-        edge_labels = {(u, v): self.edges[u, v]["type"] for u, v in self.edges}
+        edge_labels = {(u, v): t for u, v, t in self.edges(data="type")}
         nx.draw_networkx_edge_labels(self, pos, edge_labels=edge_labels)
 
         plt.axis("off")
         plt.tight_layout()
         plt.show()
 
+    def _layout_positions(self, layout: str) -> Dict[Any, Tuple[float, float]]:
+        """
+        Compute node positions for visualization.
+
+        Args:
+            layout: The name of the layout (see ``visualize``).
+
+        Returns:
+            A mapping from node to (x, y) position.
+
+        Raises:
+            ValueError: If the layout name is not recognized.
+        """
+        if layout == "spring":
+            return dict(nx.spring_layout(self, seed=42))
+
+        if layout == "dot":
+            try:
+                from networkx.drawing.nx_agraph import graphviz_layout
+
+                return dict(graphviz_layout(self, prog="dot"))
+            except ImportError:
+                layout = "layered"
+
+        if layout == "layered":
+            try:
+                layers = list(nx.topological_generations(self))
+            except nx.NetworkXUnfeasible:
+                # Cyclic graphs have no topological layering
+                return dict(nx.spring_layout(self, seed=42))
+            return {
+                node: (float(i), float(-j))
+                for i, layer in enumerate(layers)
+                for j, node in enumerate(layer)
+            }
+
+        raise ValueError(f"Unknown layout: {layout}")
+
+
+def _node_entry(intention: Intention) -> Tuple[str, Dict[str, Any]]:
+    """Convert an intention into a ``(node, attributes)`` pair for networkx."""
+    # Intern the identifying strings so that equal values are the same
+    # object, which lets the == comparisons made while scoring trajectories
+    # succeed on identity instead of comparing characters
+    return sys.intern(intention.id), {
+        "character": sys.intern(intention.character),
+        "target": sys.intern(intention.target),
+        "location": sys.intern(intention.location),
+        "description": intention.description,
+        "metadata": intention.metadata,
+    }
+
+
+def _edge_entry(dependency: Dependency) -> Tuple[str, str, Dict[str, Any]]:
+    """Convert a dependency into a ``(u, v, attributes)`` triple for networkx."""
+    return (
+        sys.intern(dependency.from_intention),
+        sys.intern(dependency.to_intention),
+        {
+            "type": sys.intern(dependency.type),
+            "description": dependency.description,
+            "metadata": dependency.metadata,
+        },
+    )
+
 
 class IDGBuilder:
     """
@@ -152,56 +445,65 @@ class IDGBuilder:
         """
         self.domain = domain
 
+    @property
+    def domain(self) -> Domain:
+        """The domain to build an IDG from."""
+        return self._domain
+
+    @domain.setter
+    def domain(self, domain: Domain) -> None:
+        self._domain = domain
+        self._snapshot: Optional[Tuple[Tuple[Any, ...], ...]] = None
+        self._idg: Optional[IDG] = None
+
+    def _refresh(self) -> None:
+        """Re-read the domain if it was changed since it was last read."""
+        domain = self._domain
+        # The tuples hold the same objects as the domain's lists, so comparing
+        # them with the previous snapshot is mostly identity checks and much
+        # cheaper than rebuilding the IDG or revalidating
+        snapshot = (
+            tuple(domain.intentions),
+            tuple(domain.dependencies),
+            tuple(domain.characters),
+            tuple(domain.locations),
+        )
+        if snapshot == self._snapshot:
+            return
+
+        self._snapshot = snapshot
+        self._intentions: Tuple[Intention, ...] = snapshot[0]
+        self._dependencies: Tuple[Dependency, ...] = snapshot[1]
+        self._intention_ids: FrozenSet[str] = frozenset(i.id for i in self._intentions)
+        # Membership checks against the domain lists are O(n) each, so keep
+        # frozensets of them for validate()
+        self._characters: FrozenSet[str] = frozenset(domain.characters)
+        self._locations: FrozenSet[str] = frozenset(domain.locations)
+        self._idg = None
+
     def build(self) -> IDG:
         """
         Build an IDG from the domain.
 
+        The IDG is built once and later calls return the same instance until
+        the domain is reassigned or its lists are changed. The returned IDG
+        is finalized, so adding or removing nodes or edges raises a
+        ``networkx.NetworkXError``; use ``build().copy()`` to get a graph
+        that can be modified.
+
         Returns:
             An IDG representing the domain.
         """
-        idg = IDG()
-
-        # Add nodes (intentions)
-        for intention_obj in self.domain.intentions:
-            # Convert to Intention if it's a dict
-            if isinstance(intention_obj, dict):
-                intention = Intention(**intention_obj)
-            else:
-                intention = intention_obj
-
-            # Create node attributes
-            node_attrs = {
-                "character": intention.character,
-                "target": intention.target,
-                "location": intention.location,
-                "description": intention.description,
-                "metadata": intention.metadata,
-            }
+        self._refresh()
+        if self._idg is None:
+            idg = IDG()
 
-            # Add node with intention data
-            idg.add_node(intention.id, **node_attrs)
-
-        # Add edges (dependencies)
-        for dependency_obj in self.domain.dependencies:
-            # Convert to Dependency if it's a dict
-            if isinstance(dependency_obj, dict):
-                dependency = Dependency(**dependency_obj)
-            else:
-                dependency = dependency_obj
-
-            # Create edge attributes
-            edge_attrs = {
-                "type": dependency.type,
-                "description": dependency.description,
-                "metadata": dependency.metadata,
-            }
+            # Add nodes (intentions) and edges (dependencies) in bulk calls
+            idg.add_nodes_from(map(_node_entry, self._intentions))
+            idg.add_edges_from(map(_edge_entry, self._dependencies))
 
-            # Add edge with dependency data
-            idg.add_edge(
-                dependency.from_intention, dependency.to_intention, **edge_attrs
-            )
-
-        return idg
+            self._idg = idg.finalize()
+        return self._idg
 
     def validate(self) -> List[str]:
         """
@@ -215,54 +517,51 @@ class IDGBuilder:
             A list of validation error messages. If the list is empty,
             the domain is valid.
         """
-        errors: List[str] = []
+        self._refresh()
+        return self._check_intentions() + self._check_dependencies()
+
+    def _check_intentions(self) -> List[str]:
+        """
+        Check that the characters, targets, and locations of intentions exist.
 
-        # Check that all characters referenced in intentions exist
-        for intention_obj in self.domain.intentions:
-            # Convert to Intention if it's a dict
-            if isinstance(intention_obj, dict):
-                intention = Intention(**intention_obj)
-            else:
-                intention = intention_obj
+        Returns:
+            A list of validation error messages.
+        """
+        errors: List[str] = []
+        characters = self._characters
+        locations = self._locations
 
-            if intention.character not in self.domain.characters:
+        # Check the characters, target, and location of every intention in a
+        # single pass
+        for intention in self._intentions:
+            if intention.character not in characters:
                 errors.append(
                     f"Character '{intention.character}' missing (id: {intention.id})."
                 )
 
-            if intention.target not in self.domain.characters:
+            if intention.target not in characters:
                 errors.append(
                     f"Target '{intention.target}' missing (id: {intention.id})."
                 )
 
-        # Check that all locations referenced in intentions exist
-        for intention_obj in self.domain.intentions:
-            # Convert to Intention if it's a dict
-            if isinstance(intention_obj, dict):
-                intention = Intention(**intention_obj)
-            else:
-                intention = intention_obj
-
-            if intention.location not in self.domain.locations:
+            if intention.location not in locations:
                 errors.append(
                     f"Location '{intention.location}' missing (id: {intention.id})."
                 )
 
-        # Check that all intentions referenced in dependencies exist
-        intention_ids = set()
-        for intention_obj in self.domain.intentions:
-            if isinstance(intention_obj, dict):
-                intention_ids.add(intention_obj["id"])
-            else:
-                intention_ids.add(intention_obj.id)
-
-        for dependency_obj in self.domain.dependencies:
-            # Convert to Dependency if it's a dict
-            if isinstance(dependency_obj, dict):
-                dependency = Dependency(**dependency_obj)
-            else:
-                dependency = dependency_obj
+        return errors
+
+    def _check_dependencies(self) -> List[str]:
+        """
+        Check that the intentions referenced in dependencies exist.
+
+        Returns:
+            A list of validation error messages.
+        """
+        errors: List[str] = []
+        intention_ids = self._intention_ids
 
+        for dependency in self._dependencies:
             if dependency.from_intention not in intention_ids:
                 errors.append(f"From-intention '{dependency.from_intention}' missing.")
 
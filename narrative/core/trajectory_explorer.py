@@ -8,14 +8,198 @@ and ranks trajectories through an Intention Dependency Graph (IDG).
 
 # mypy: disable-error-code="attr-defined"
 
+import heapq
 import random
+import re
+from array import array
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol, Union
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from narrative.core.idg_builder import IDG, CSRAdjacency
+
+# Keywords that indicate conflict or emotional intensity
+_CONFLICT_KEYWORDS = frozenset(
+    {
+        "eat",
+        "kill",
+        "attack",
+        "fight",
+        "steal",
+        "trick",
+        "deceive",
+    }
+)
+_EMOTIONAL_KEYWORDS = frozenset(
+    {
+        "love",
+        "hate",
+        "fear",
+        "anger",
+        "joy",
+        "sadness",
+        "surprise",
+    }
+)
+
+# Each keyword set as one alternation, so a string is scanned once per set
+_CONFLICT_RE = re.compile("|".join(map(re.escape, sorted(_CONFLICT_KEYWORDS))))
+_EMOTIONAL_RE = re.compile("|".join(map(re.escape, sorted(_EMOTIONAL_KEYWORDS))))
+
+
+class IntentionTable:
+    """
+    Column-oriented (structure-of-arrays) view of the intentions in an IDG.
+
+    Intentions are numbered like the nodes of ``IDG.csr()``. Character,
+    target, and location names are interned to small integers and stored in
+    parallel int arrays, so metrics can compare integers instead of looking
+    up and comparing strings in per-intention dicts. Characters and targets
+    share one numbering, since metrics compare them with each other.
+
+    Columns are built from the IDG's node attributes on first use, so a
+    table reflects the IDG as it was when it was first read. The explorer
+    builds a new table for each call.
+
+    Attributes:
+        csr: The IDG adjacency the table was built from.
+        index: A mapping from intention ID to intention number.
+    """
+
+    def __init__(self, idg: IDG):
+        """
+        Build the table for an IDG.
+
+        Args:
+            idg: The IDG to tabulate.
+        """
+        self.csr: CSRAdjacency = idg.csr()
+        self.index: Dict[str, int] = self.csr.node_index
+        self._nodes = idg.nodes
 
-from narrative.core.idg_builder import IDG
+    def record(self, row: int) -> Dict[str, Any]:
+        """
+        Get the intention data of an intention, including its ID.
 
+        Args:
+            row: The intention number.
 
-@dataclass
+        Returns:
+            A new dict of the intention's current node attributes and its ID.
+        """
+        intention_id = self.csr.node_ids[row]
+        return {"id": intention_id, **self._nodes[intention_id]}
+
+    @cached_property
+    def _entity_columns(self) -> Tuple[array, array, array]:
+        """Intern the characters, targets, and locations of all intentions."""
+        node_data = [self._nodes[node] for node in self.csr.node_ids]
+        characters: Dict[Any, int] = {}
+        locations: Dict[Any, int] = {}
+        character_column = [
+            characters.setdefault(data.get("character"), len(characters))
+            for data in node_data
+        ]
+        target_column = [
+            characters.setdefault(data.get("target"), len(characters))
+            for data in node_data
+        ]
+        location_column = [
+            locations.setdefault(data.get("location"), len(locations))
+            for data in node_data
+        ]
+        return (
+            array("i", character_column),
+            array("i", target_column),
+            array("i", location_column),
+        )
+
+    @cached_property
+    def characters(self) -> array:
+        """The interned character of each intention."""
+        return self._entity_columns[0]
+
+    @cached_property
+    def targets(self) -> array:
+        """The interned target of each intention."""
+        return self._entity_columns[1]
+
+    @cached_property
+    def locations(self) -> array:
+        """The interned location of each intention."""
+        return self._entity_columns[2]
+
+    @cached_property
+    def character_bits(self) -> List[int]:
+        """A bitset of the interned character and target of each intention."""
+        # Bitsets let distinct entities be counted by OR-ing and popcount
+        return [
+            1 << c | 1 << t for c, t in zip(self.characters, self.targets, strict=True)
+        ]
+
+    @cached_property
+    def location_bits(self) -> List[int]:
+        """A bitset of the interned location of each intention."""
+        return [1 << loc for loc in self.locations]
+
+    @cached_property
+    def conflicts(self) -> array:
+        """1 for each intention that is a conflict, else 0."""
+        return array("b", [conflict for conflict, _ in self._drama])
+
+    @cached_property
+    def emotions(self) -> array:
+        """The emotional intensity of each intention."""
+        return array("d", [emotion for _, emotion in self._drama])
+
+    @cached_property
+    def _drama(self) -> List[Tuple[int, float]]:
+        """Match the drama keywords against every intention once."""
+        # Only drama scoring needs these columns, and keyword matching
+        # requires string intention IDs, so it is deferred to first use
+        return [_intention_drama(self.record(row)) for row in range(len(self.index))]
+
+    def successors(self, row: int) -> Sequence[int]:
+        """
+        Get the intention numbers of the successors of an intention.
+
+        Args:
+            row: The intention number.
+
+        Returns:
+            The successors' intention numbers, in the IDG's successor order.
+        """
+        indptr = self.csr.succ_indptr
+        return self.csr.succ_indices[indptr[row] : indptr[row + 1]]
+
+    def trajectory(self, rows: Sequence[int]) -> "Trajectory":
+        """
+        Build a trajectory from a sequence of intention numbers.
+
+        Args:
+            rows: The intention numbers, in trajectory order.
+
+        Returns:
+            A trajectory with a new intention dict for each intention.
+        """
+        record = self.record
+        return Trajectory(intentions=[record(i) for i in rows])
+
+
+@dataclass(slots=True)
 class Trajectory:
     """
     A trajectory through an IDG.
@@ -30,6 +214,15 @@ class Trajectory:
     intentions: List[Dict[str, Any]]
     metadata: Optional[Dict[str, Any]] = None
 
+    def key(self) -> Tuple[str, ...]:
+        """
+        Get the sequence of intention IDs that identifies this trajectory.
+
+        Returns:
+            A tuple of the intention IDs, in trajectory order.
+        """
+        return tuple(intention["id"] for intention in self.intentions)
+
 
 class MetricProtocol(Protocol):
     """Protocol for trajectory metrics."""
@@ -59,7 +252,133 @@ class NoveltyMetric:
         if not trajectory.intentions:
             return 0.0
 
-        # Count unique characters, locations, and intention IDs
+        # Equivalent to _combine() with no remaining steps, inlined since
+        # this runs once per trajectory when ranking
+        num_characters, num_locations, num_ids = self._count_unique(trajectory)
+        length = len(trajectory.intentions)
+        return (
+            num_characters / (2 * length) + num_locations / length + num_ids / length
+        ) / 3
+
+    def upper_bound(self, trajectory: Trajectory, remaining_steps: int) -> float:
+        """
+        Bound the novelty of any extension of a trajectory.
+
+        The bound assumes that every remaining intention introduces two new
+        characters, a new location, and a new intention ID.
+
+        Args:
+            trajectory: The partial trajectory.
+            remaining_steps: The maximum number of intentions that may still
+                be appended to the trajectory.
+
+        Returns:
+            An upper bound on the score of the trajectory and all of its
+            extensions.
+        """
+        if not trajectory.intentions:
+            return 1.0
+
+        num_characters, num_locations, num_ids = self._count_unique(trajectory)
+        return self._combine(
+            len(trajectory.intentions),
+            num_characters,
+            num_locations,
+            num_ids,
+            max(remaining_steps, 0),
+        )
+
+    def update(
+        self,
+        state: Optional[Tuple[int, int, int, int]],
+        table: IntentionTable,
+        row: int,
+    ) -> Tuple[int, int, int, int]:
+        """
+        Extend an incremental scoring state by one intention.
+
+        The state is the trajectory length and bitsets of the interned
+        characters, locations, and intention numbers seen so far.
+
+        Args:
+            state: The state of the trajectory so far, or None if it is empty.
+            table: The intention table the rows belong to.
+            row: The intention number of the appended intention.
+
+        Returns:
+            The state of the extended trajectory.
+        """
+        length, characters, locations, intention_ids = state or (0, 0, 0, 0)
+        return (
+            length + 1,
+            characters | table.character_bits[row],
+            locations | table.location_bits[row],
+            intention_ids | 1 << row,
+        )
+
+    def score_state(self, state: Tuple[int, int, int, int]) -> float:
+        """
+        Score a non-empty trajectory from its incremental state.
+
+        Args:
+            state: The state returned by ``update``.
+
+        Returns:
+            The same score as ``score`` for the trajectory.
+        """
+        length, characters, locations, intention_ids = state
+        return self._combine(
+            length,
+            characters.bit_count(),
+            locations.bit_count(),
+            intention_ids.bit_count(),
+            0,
+        )
+
+    def upper_bound_state(
+        self, state: Tuple[int, int, int, int], remaining_steps: int
+    ) -> float:
+        """
+        Bound the novelty of a non-empty trajectory from its incremental state.
+
+        Args:
+            state: The state returned by ``update``.
+            remaining_steps: The maximum number of intentions that may still
+                be appended to the trajectory.
+
+        Returns:
+            The same bound as ``upper_bound`` for the trajectory.
+        """
+        length, characters, locations, intention_ids = state
+        return self._combine(
+            length,
+            characters.bit_count(),
+            locations.bit_count(),
+            intention_ids.bit_count(),
+            max(remaining_steps, 0),
+        )
+
+    @staticmethod
+    def _combine(
+        length: int,
+        num_characters: int,
+        num_locations: int,
+        num_ids: int,
+        remaining: int,
+    ) -> float:
+        """Combine unique counts into a score, assuming the remaining steps are novel."""
+        # Calculate diversity scores
+        character_diversity = (num_characters + 2 * remaining) / (
+            2 * (length + remaining)
+        )
+        location_diversity = (num_locations + remaining) / (length + remaining)
+        intention_diversity = (num_ids + remaining) / (length + remaining)
+
+        # Combine scores (equal weighting)
+        return (character_diversity + location_diversity + intention_diversity) / 3
+
+    def _count_unique(self, trajectory: Trajectory) -> Tuple[int, int, int]:
+        """Count the unique characters, locations, and intention IDs."""
         characters = set()
         locations = set()
         intention_ids = set()
@@ -70,13 +389,7 @@ class NoveltyMetric:
             locations.add(intention["location"])
             intention_ids.add(intention["id"])
 
-        # Calculate diversity scores
-        character_diversity = len(characters) / (2 * len(trajectory.intentions))
-        location_diversity = len(locations) / len(trajectory.intentions)
-        intention_diversity = len(intention_ids) / len(trajectory.intentions)
-
-        # Combine scores (equal weighting)
-        return (character_diversity + location_diversity + intention_diversity) / 3
+        return len(characters), len(locations), len(intention_ids)
 
 
 class CoherenceMetric:
@@ -100,8 +413,102 @@ class CoherenceMetric:
         if len(trajectory.intentions) <= 1:
             return 1.0  # A single intention is maximally coherent
 
-        continuity_score = 0.0
+        return self._continuity(trajectory) / (len(trajectory.intentions) - 1)
+
+    def upper_bound(self, trajectory: Trajectory, remaining_steps: int) -> float:
+        """
+        Bound the coherence of any extension of a trajectory.
+
+        The bound assumes that every remaining pair of adjacent intentions is
+        fully continuous.
+
+        Args:
+            trajectory: The partial trajectory.
+            remaining_steps: The maximum number of intentions that may still
+                be appended to the trajectory.
 
+        Returns:
+            An upper bound on the score of the trajectory and all of its
+            extensions.
+        """
+        if len(trajectory.intentions) <= 1:
+            return 1.0
+
+        continuity_score = self._continuity(trajectory)
+        return self._combine(
+            len(trajectory.intentions), continuity_score, max(remaining_steps, 0)
+        )
+
+    def update(
+        self,
+        state: Optional[Tuple[int, int, float]],
+        table: IntentionTable,
+        row: int,
+    ) -> Tuple[int, int, float]:
+        """
+        Extend an incremental scoring state by one intention.
+
+        The state is the trajectory length, the intention number of its last
+        intention, and the continuity score so far.
+
+        Args:
+            state: The state of the trajectory so far, or None if it is empty.
+            table: The intention table the rows belong to.
+            row: The intention number of the appended intention.
+
+        Returns:
+            The state of the extended trajectory.
+        """
+        if state is None:
+            return 1, row, 0.0
+        length, last_row, continuity_score = state
+        continuity_score += _pair_continuity(
+            last_row, row, table.characters, table.targets, table.locations
+        )
+        return length + 1, row, continuity_score
+
+    def score_state(self, state: Tuple[int, int, float]) -> float:
+        """
+        Score a non-empty trajectory from its incremental state.
+
+        Args:
+            state: The state returned by ``update``.
+
+        Returns:
+            The same score as ``score`` for the trajectory.
+        """
+        length, _, continuity_score = state
+        if length <= 1:
+            return 1.0
+        return self._combine(length, continuity_score, 0)
+
+    def upper_bound_state(
+        self, state: Tuple[int, int, float], remaining_steps: int
+    ) -> float:
+        """
+        Bound the coherence of a non-empty trajectory from its incremental state.
+
+        Args:
+            state: The state returned by ``update``.
+            remaining_steps: The maximum number of intentions that may still
+                be appended to the trajectory.
+
+        Returns:
+            The same bound as ``upper_bound`` for the trajectory.
+        """
+        length, _, continuity_score = state
+        if length <= 1:
+            return 1.0
+        return self._combine(length, continuity_score, max(remaining_steps, 0))
+
+    @staticmethod
+    def _combine(length: int, continuity_score: float, remaining: int) -> float:
+        """Normalize a continuity score, assuming the remaining pairs are continuous."""
+        return (continuity_score + remaining) / (length - 1 + remaining)
+
+    def _continuity(self, trajectory: Trajectory) -> float:
+        """Sum the continuity scores of adjacent intention pairs."""
+        continuity_score = 0.0
         for i in range(len(trajectory.intentions) - 1):
             current = trajectory.intentions[i]
             next_intention = trajectory.intentions[i + 1]
@@ -121,7 +528,7 @@ class CoherenceMetric:
             pair_score = (int(character_continuity) + int(location_continuity)) / 2
             continuity_score += pair_score
 
-        return continuity_score / (len(trajectory.intentions) - 1)
+        return continuity_score
 
 
 class DramaMetric:
@@ -145,61 +552,246 @@ class DramaMetric:
         if not trajectory.intentions:
             return 0.0
 
-        # Count conflict indicators
-        conflict_count = 0
-        character_arcs = set()
-        emotional_intensity = 0.0
+        conflict_count, num_characters, emotional_intensity = self._tally(trajectory)
+        return self._combine(
+            len(trajectory.intentions),
+            conflict_count,
+            num_characters,
+            emotional_intensity,
+            0,
+        )
 
-        # Keywords that indicate conflict or emotional intensity
-        conflict_keywords = {
-            "eat",
-            "kill",
-            "attack",
-            "fight",
-            "steal",
-            "trick",
-            "deceive",
-        }
-        emotional_keywords = {
-            "love",
-            "hate",
-            "fear",
-            "anger",
-            "joy",
-            "sadness",
-            "surprise",
-        }
+    def upper_bound(self, trajectory: Trajectory, remaining_steps: int) -> float:
+        """
+        Bound the dramatic potential of any extension of a trajectory.
 
-        for intention in trajectory.intentions:
-            # Check for conflict in intention ID
-            for keyword in conflict_keywords:
-                if keyword in intention["id"]:
-                    conflict_count += 1
-                    break
+        The bound assumes that every remaining intention is a conflict,
+        introduces two new characters, and is fully emotional.
 
-            # Track character arcs (characters that appear in multiple intentions)
-            character_arcs.add(intention["character"])
-            character_arcs.add(intention["target"])
+        Args:
+            trajectory: The partial trajectory.
+            remaining_steps: The maximum number of intentions that may still
+                be appended to the trajectory.
+
+        Returns:
+            An upper bound on the score of the trajectory and all of its
+            extensions.
+        """
+        if not trajectory.intentions:
+            return 1.0
+
+        conflict_count, num_characters, emotional_intensity = self._tally(trajectory)
+        return self._combine(
+            len(trajectory.intentions),
+            conflict_count,
+            num_characters,
+            emotional_intensity,
+            max(remaining_steps, 0),
+        )
+
+    def update(
+        self,
+        state: Optional[Tuple[int, int, int, float]],
+        table: IntentionTable,
+        row: int,
+    ) -> Tuple[int, int, int, float]:
+        """
+        Extend an incremental scoring state by one intention.
+
+        The state is the trajectory length, the conflict count, a bitset of
+        the interned characters seen so far, and the emotional intensity.
+
+        Args:
+            state: The state of the trajectory so far, or None if it is empty.
+            table: The intention table the rows belong to.
+            row: The intention number of the appended intention.
+
+        Returns:
+            The state of the extended trajectory.
+        """
+        length, conflict_count, characters, emotional_intensity = state or (
+            0,
+            0,
+            0,
+            0.0,
+        )
+        return (
+            length + 1,
+            conflict_count + table.conflicts[row],
+            characters | table.character_bits[row],
+            emotional_intensity + table.emotions[row],
+        )
+
+    def score_state(self, state: Tuple[int, int, int, float]) -> float:
+        """
+        Score a non-empty trajectory from its incremental state.
+
+        Args:
+            state: The state returned by ``update``.
 
-            # Check for emotional intensity in intention ID or description
-            for keyword in emotional_keywords:
-                if keyword in intention["id"]:
-                    emotional_intensity += 1
-                    break
-                if intention.get("description") and keyword in intention["description"]:
-                    emotional_intensity += 0.5
-                    break
+        Returns:
+            The same score as ``score`` for the trajectory.
+        """
+        length, conflict_count, characters, emotional_intensity = state
+        return self._combine(
+            length, conflict_count, characters.bit_count(), emotional_intensity, 0
+        )
+
+    def upper_bound_state(
+        self, state: Tuple[int, int, int, float], remaining_steps: int
+    ) -> float:
+        """
+        Bound the dramatic potential of a non-empty trajectory from its state.
+
+        Args:
+            state: The state returned by ``update``.
+            remaining_steps: The maximum number of intentions that may still
+                be appended to the trajectory.
 
+        Returns:
+            The same bound as ``upper_bound`` for the trajectory.
+        """
+        length, conflict_count, characters, emotional_intensity = state
+        return self._combine(
+            length,
+            conflict_count,
+            characters.bit_count(),
+            emotional_intensity,
+            max(remaining_steps, 0),
+        )
+
+    @staticmethod
+    def _combine(
+        length: int,
+        conflict_count: int,
+        num_characters: int,
+        emotional_intensity: float,
+        remaining: int,
+    ) -> float:
+        """Combine tallies into a score, assuming the remaining steps are dramatic."""
         # Calculate scores
-        conflict_score = min(1.0, conflict_count / len(trajectory.intentions))
+        conflict_score = min(1.0, (conflict_count + remaining) / (length + remaining))
         character_arc_score = min(
-            1.0, len(character_arcs) / (2 * len(trajectory.intentions))
+            1.0, (num_characters + 2 * remaining) / (2 * (length + remaining))
+        )
+        emotional_score = min(
+            1.0, (emotional_intensity + remaining) / (length + remaining)
         )
-        emotional_score = min(1.0, emotional_intensity / len(trajectory.intentions))
 
         # Combine scores (equal weighting)
         return (conflict_score + character_arc_score + emotional_score) / 3
 
+    def _tally(self, trajectory: Trajectory) -> Tuple[int, int, float]:
+        """Tally the conflicts, distinct characters, and emotional intensity."""
+        conflict_count = 0
+        character_arcs: Set[Any] = set()
+        emotional_intensity = 0.0
+
+        for intention in trajectory.intentions:
+            conflict, emotion = _intention_drama(intention)
+            conflict_count += conflict
+            emotional_intensity += emotion
+
+            # Track character arcs (characters that appear in multiple intentions)
+            character_arcs.add(intention["character"])
+            character_arcs.add(intention["target"])
+
+        return conflict_count, len(character_arcs), emotional_intensity
+
+
+def _intention_drama(intention: Dict[str, Any]) -> Tuple[int, float]:
+    """
+    Get the conflict indicator and emotional intensity of a single intention.
+
+    Args:
+        intention: The intention data, including its ID.
+
+    Returns:
+        A tuple of 1 if the intention is a conflict (else 0) and its
+        emotional intensity (1 for an emotional ID, 0.5 for an emotional
+        description, else 0).
+    """
+    # Check for conflict in intention ID
+    conflict = 1 if _CONFLICT_RE.search(intention["id"]) else 0
+
+    # Check for emotional intensity in intention ID or description
+    emotion = 0.0
+    if _EMOTIONAL_RE.search(intention["id"]):
+        emotion = 1.0
+    elif intention.get("description") and _EMOTIONAL_RE.search(
+        intention["description"]
+    ):
+        emotion = 0.5
+
+    return conflict, emotion
+
+
+def _pair_continuity(
+    a: int,
+    b: int,
+    characters: Sequence[int],
+    targets: Sequence[int],
+    locations: Sequence[int],
+) -> float:
+    """
+    Score the continuity of two adjacent intentions over interned columns.
+
+    Args:
+        a: The intention number of the earlier intention.
+        b: The intention number of the later intention.
+        characters: The interned character column.
+        targets: The interned target column.
+        locations: The interned location column.
+
+    Returns:
+        The pair score: 0.5 each for character and location continuity.
+    """
+    character_a, target_a = characters[a], targets[a]
+    character_b, target_b = characters[b], targets[b]
+    character_continuity = (
+        character_a == character_b
+        or character_a == target_b
+        or target_a == character_b
+        or target_a == target_b
+    )
+    location_continuity = locations[a] == locations[b]
+    return (int(character_continuity) + int(location_continuity)) / 2
+
+
+def _unique_trajectories(trajectories: Iterable[Trajectory]) -> Iterator[Trajectory]:
+    """Yield the first trajectory for each distinct sequence of intention IDs."""
+    seen: Set[Tuple[str, ...]] = set()
+    for trajectory in trajectories:
+        key = trajectory.key()
+        if key not in seen:
+            seen.add(key)
+            yield trajectory
+
+
+class _TrajectoryScorer:
+    """
+    Incremental scoring interface for metrics that only score whole trajectories.
+
+    The state is the trajectory itself, so every step is scored from scratch.
+    """
+
+    def __init__(self, metric: Any):
+        self.metric = metric
+
+    def update(
+        self, state: Optional[Trajectory], table: IntentionTable, row: int
+    ) -> Trajectory:
+        intentions = state.intentions if state is not None else []
+        return Trajectory(intentions=intentions + [table.record(row)])
+
+    def score_state(self, state: Trajectory) -> float:
+        score: float = self.metric.score(state)
+        return score
+
+    def upper_bound_state(self, state: Trajectory, remaining_steps: int) -> float:
+        bound: float = self.metric.upper_bound(state, remaining_steps)
+        return bound
+
 
 class TrajectoryExplorer:
     """
@@ -214,7 +806,7 @@ class TrajectoryExplorer:
             idg: The IDG to explore.
         """
         self.idg = idg
-        self.metrics = {
+        self.metrics: Dict[str, MetricProtocol] = {
             "novelty": NoveltyMetric(),
             "coherence": CoherenceMetric(),
             "drama": DramaMetric(),
@@ -234,72 +826,200 @@ class TrajectoryExplorer:
         Returns:
             A list of trajectories.
         """
-        if start_intentions is None:
-            start_intentions = list(self.idg.get_root_intentions())
+        return list(self.iter_trajectories(max_length, start_intentions))
 
-        trajectories: List[Trajectory] = []
+    def iter_trajectories(
+        self, max_length: int = 5, start_intentions: Optional[List[str]] = None
+    ) -> Iterator[Trajectory]:
+        """
+        Lazily generate all possible trajectories through the IDG.
 
-        for start_intention in start_intentions:
-            # Start with a trajectory containing just the start intention
-            intention_data = self.idg.get_intention_data(start_intention)
-            initial_trajectory = Trajectory(
-                intentions=[{"id": start_intention, **intention_data}]
-            )
+        This yields the same trajectories in the same order as
+        ``get_trajectories`` without holding them all in memory.
 
-            # Use DFS to explore all possible trajectories
-            self._explore_trajectories(initial_trajectory, max_length, trajectories)
+        Args:
+            max_length: The maximum length of trajectories to generate.
+            start_intentions: Optional list of intention IDs to start trajectories from.
+                If not provided, trajectories will start from all root intentions.
 
-        return trajectories
+        Yields:
+            Trajectories, each followed by its extensions (depth-first).
+        """
+        if start_intentions is None:
+            start_intentions = list(self.idg.get_root_intentions())
 
-    def _explore_trajectories(
+        table = IntentionTable(self.idg)
+        index = table.index
+        record = table.record
+        successors = table.successors
+
+        # The IDG has no parallel edges, so repeated start intentions are the
+        # only way the DFS could generate the same trajectory twice
+        for start_intention in dict.fromkeys(start_intentions):
+            # Use an iterative DFS over the table's integer adjacency:
+            # stack[i] iterates the successors of path[i]. Each step creates
+            # one intention dict, which the trajectory shares with its
+            # extensions, and the path is only copied when it is emitted.
+            path = [record(index[start_intention])]
+            yield Trajectory(intentions=path.copy())
+
+            stack: List[Iterator[int]] = []
+            if max_length > 1:
+                stack.append(iter(successors(index[start_intention])))
+
+            while stack:
+                successor = next(stack[-1], None)
+                if successor is None:
+                    # All successors explored, backtrack
+                    stack.pop()
+                    path.pop()
+                    continue
+
+                path.append(record(successor))
+                yield Trajectory(intentions=path.copy())
+
+                if len(path) < max_length:
+                    stack.append(iter(successors(successor)))
+                else:
+                    path.pop()
+
+    def get_top_trajectories(
         self,
-        current_trajectory: Trajectory,
-        max_length: int,
-        all_trajectories: List[Trajectory],
-    ) -> None:
+        k: int,
+        metric: Union[str, MetricProtocol] = "novelty",
+        max_length: int = 5,
+        start_intentions: Optional[List[str]] = None,
+    ) -> List[Trajectory]:
         """
-        Recursively explore all possible trajectories from a starting trajectory.
+        Generate the k best trajectories through the IDG according to a metric.
+
+        This is equivalent to ranking every trajectory from
+        ``get_trajectories`` and keeping the first k, but only k trajectories
+        are held in memory. If the metric provides an
+        ``upper_bound(trajectory, remaining_steps)`` method, as the built-in
+        metrics do, branches that cannot beat the current k-th best score
+        are pruned without being enumerated.
+
+        Metrics that also provide ``update``, ``score_state``, and
+        ``upper_bound_state`` methods, as the built-in metrics do, are scored
+        incrementally: each trajectory is scored from the state of its
+        prefix, and trajectories are only built for the final top k.
 
         Args:
-            current_trajectory: The current trajectory being explored.
+            k: The number of trajectories to return.
+            metric: The metric to rank by. Can be a string
+                (name of a registered metric)
+                or a custom metric object with a score method.
             max_length: The maximum length of trajectories to generate.
-            all_trajectories: A list to store all generated trajectories.
+            start_intentions: Optional list of intention IDs to start trajectories from.
+                If not provided, trajectories will start from all root intentions.
+
+        Returns:
+            Up to k trajectories sorted by score (highest first).
+
+        Raises:
+            ValueError: If the metric name is not recognized.
         """
-        # Add the current trajectory to the list
-        all_trajectories.append(current_trajectory)
+        metric_obj = self._get_metric(metric)
 
-        # If we've reached the maximum length, stop exploring
-        if len(current_trajectory.intentions) >= max_length:
-            return
+        if k <= 0:
+            return []
 
-        # Get the last intention in the current trajectory
-        last_intention_id = current_trajectory.intentions[-1]["id"]
+        if start_intentions is None:
+            start_intentions = list(self.idg.get_root_intentions())
 
-        # Find all intentions that depend on the last intention
-        for successor in self.idg.successors(last_intention_id):
-            # Create a new trajectory by adding the successor
-            successor_data = self.idg.get_intention_data(successor)
-            new_intentions = current_trajectory.intentions + [
-                {"id": successor, **successor_data}
-            ]
-            new_trajectory = Trajectory(intentions=new_intentions)
+        if all(
+            hasattr(metric_obj, name)
+            for name in ("update", "score_state", "upper_bound_state")
+        ):
+            scorer: Any = metric_obj
+        else:
+            scorer = _TrajectoryScorer(metric_obj)
+
+        update = scorer.update
+        score_state = scorer.score_state
+        upper_bound_state = scorer.upper_bound_state
+        can_prune = not isinstance(scorer, _TrajectoryScorer) or hasattr(
+            metric_obj, "upper_bound"
+        )
 
-            # Recursively explore from the new trajectory
-            self._explore_trajectories(new_trajectory, max_length, all_trajectories)
+        # Min-heap of the k best (score, -order, rows) entries. Ties are
+        # broken in favour of earlier trajectories, matching the stable sort
+        # in rank_trajectories.
+        heap: List[Tuple[float, int, Tuple[int, ...]]] = []
+        order = 0
+        table = IntentionTable(self.idg)
+        index = table.index
+        successors = table.successors
+
+        for start_intention in dict.fromkeys(start_intentions):
+            # states[i] is the metric state of path[:i + 1], so each node is
+            # scored from its parent's state rather than from scratch
+            path: List[int] = []
+            states: List[Any] = []
+            stack: List[Iterator[int]] = [iter([index[start_intention]])]
+
+            while stack:
+                row = next(stack[-1], None)
+                if row is None:
+                    # All successors explored, backtrack
+                    stack.pop()
+                    if path:
+                        path.pop()
+                        states.pop()
+                    continue
+
+                state = update(states[-1] if states else None, table, row)
+
+                # Prune the branch if no extension can enter the top k. Later
+                # trajectories lose ties, so an equal bound is enough.
+                if (
+                    can_prune
+                    and len(heap) == k
+                    and upper_bound_state(state, max_length - len(path) - 1)
+                    <= heap[0][0]
+                ):
+                    continue
+
+                path.append(row)
+                states.append(state)
+
+                entry_key = (score_state(state), -order)
+                order += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, (*entry_key, tuple(path)))
+                elif entry_key > heap[0][:2]:
+                    heapq.heapreplace(heap, (*entry_key, tuple(path)))
+
+                if len(path) < max_length:
+                    stack.append(iter(successors(row)))
+                else:
+                    path.pop()
+                    states.pop()
+
+        heap.sort(key=lambda entry: entry[:2], reverse=True)
+        return [table.trajectory(rows) for _, _, rows in heap]
 
     def rank_trajectories(
         self,
-        trajectories: List[Trajectory],
+        trajectories: Iterable[Trajectory],
         metric: Union[str, MetricProtocol] = "novelty",
+        k: Optional[int] = None,
+        unique: bool = False,
     ) -> List[Trajectory]:
         """
         Rank trajectories according to a metric.
 
         Args:
-            trajectories: The trajectories to rank.
+            trajectories: The trajectories to rank. Any iterable is accepted,
+                e.g. ``iter_trajectories()``.
             metric: The metric to use for ranking. Can be a string
                 (name of a built-in metric)
                 or a custom metric object with a score method.
+            k: Optional number of trajectories to keep. If provided, only the
+                k best trajectories are held in memory while ranking.
+            unique: Whether to drop trajectories with the same sequence of
+                intention IDs as an earlier one before scoring.
 
         Returns:
             A list of trajectories sorted by score (highest first).
@@ -307,41 +1027,53 @@ class TrajectoryExplorer:
         Raises:
             ValueError: If the metric name is not recognized.
         """
+        # Look up the bound score method once, not once per trajectory
+        score = self._get_metric(metric).score
+        score_fn: Callable[[Trajectory], float] = score
+
+        if not isinstance(metric, str):
+            # Report errors from custom metrics as ValueErrors
+            def score_or_raise(t: Trajectory) -> float:
+                try:
+                    return score(t)
+                except Exception as e:
+                    raise ValueError(f"Error scoring trajectory: {e}") from e
+
+            score_fn = score_or_raise
+
+        if unique:
+            trajectories = _unique_trajectories(trajectories)
+
+        # Score and sort trajectories. Both are stable, so ties keep their
+        # original order.
+        if k is not None:
+            return heapq.nlargest(k, trajectories, key=score_fn)
+        return sorted(trajectories, key=score_fn, reverse=True)
+
+    def _get_metric(self, metric: Union[str, MetricProtocol]) -> MetricProtocol:
+        """
+        Get a metric object from a metric name or custom metric object.
+
+        Args:
+            metric: The name of a registered metric or a custom metric object.
+
+        Returns:
+            The metric object.
+
+        Raises:
+            ValueError: If the metric name is not recognized, or the custom
+                metric has no score method.
+        """
         # Handle string metric names
         if isinstance(metric, str):
             if metric not in self.metrics:
                 raise ValueError(f"Unknown metric: {metric}")
-            metric_obj = self.metrics[metric]
+            return self.metrics[metric]
 
-            # Score and sort trajectories
-            scored_trajectories: List[tuple[Trajectory, float]] = [
-                (t, metric_obj.score(t)) for t in trajectories
-            ]
-            scored_trajectories.sort(key=lambda x: x[1], reverse=True)
-
-            return [t for t, _ in scored_trajectories]
-
-        # For custom metric objects, we need to use a different approach
-        # First, ensure it has a score method
-        if not hasattr(metric, "score") or not callable(metric.score):
+        # Custom metric objects must have a score method
+        if not callable(getattr(metric, "score", None)):
             raise ValueError("Custom metric must have a 'score' method")
-
-        # mypy: disable-error-code="attr-defined"
-        custom_metric = metric  # type: ignore
-
-        # Score and sort trajectories
-        scored_trajectories = []
-        for t in trajectories:
-            try:
-                # This is safe because we've checked that the method exists
-                # and is callable
-                score = custom_metric.score(t)  # type: ignore
-                scored_trajectories.append((t, score))
-            except Exception as e:
-                raise ValueError(f"Error scoring trajectory: {e}") from e
-
-        scored_trajectories.sort(key=lambda x: x[1], reverse=True)
-        return [t for t, _ in scored_trajectories]
+        return metric
 
     def add_metric(self, name: str, metric: MetricProtocol) -> None:
         """
@@ -372,24 +1104,41 @@ class TrajectoryExplorer:
         if start_intentions is None:
             start_intentions = list(self.idg.get_root_intentions())
 
+        table = IntentionTable(self.idg)
+
         # Choose a random start intention
         start_intention = random.choice(start_intentions)
-        intention_data = self.idg.get_intention_data(start_intention)
-        trajectory = Trajectory(intentions=[{"id": start_intention, **intention_data}])
+        path = [table.index[start_intention]]
 
         # Build the trajectory by randomly choosing successors
-        current_intention = start_intention
-        while len(trajectory.intentions) < max_length:
-            # Get all successors of the current intention
-            successors = list(self.idg.successors(current_intention))
-            if not successors:
+        while len(path) < max_length:
+            # Choose a random successor
+            successor = self._random_successor(table, path[-1])
+            if successor is None:
                 break  # No more successors, end the trajectory
 
-            # Choose a random successor
-            next_intention = random.choice(successors)
-            next_data = self.idg.get_intention_data(next_intention)
-            trajectory.intentions.append({"id": next_intention, **next_data})
+            path.append(successor)
 
-            current_intention = next_intention
+        return table.trajectory(path)
 
-        return trajectory
+    def _random_successor(self, table: IntentionTable, row: int) -> Optional[int]:
+        """
+        Choose a random successor of an intention.
+
+        The successor is picked by position from the table's CSR adjacency, so
+        no list of successors is built.
+
+        Args:
+            table: The intention table for the current IDG.
+            row: The intention number of the intention.
+
+        Returns:
+            The intention number of a uniformly chosen successor, or None if
+            the intention has no successors.
+        """
+        indptr = table.csr.succ_indptr
+        start, end = indptr[row], indptr[row + 1]
+        if start == end:
+            return None
+        successor: int = table.csr.succ_indices[start + random.randrange(end - start)]
+        return successor
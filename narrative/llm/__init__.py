@@ -4,11 +4,39 @@ LLM Package
 This package contains components for working with large language models (LLMs).
 """
 
-from narrative.llm.llm_renderer import (
-    LLMAdapter,
-    LLMRenderer,
-    MockLLMAdapter,
-    OpenAIAdapter,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from narrative.llm.llm_renderer import (
+        LLMAdapter,
+        LLMRenderer,
+        MockLLMAdapter,
+        OpenAIAdapter,
+    )
+
+# Submodules are imported lazily on first access (PEP 562)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "LLMRenderer": ("narrative.llm.llm_renderer", "LLMRenderer"),
+    "LLMAdapter": ("narrative.llm.llm_renderer", "LLMAdapter"),
+    "MockLLMAdapter": ("narrative.llm.llm_renderer", "MockLLMAdapter"),
+    "OpenAIAdapter": ("narrative.llm.llm_renderer", "OpenAIAdapter"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import LLM classes on first access."""
+    if name in _LAZY:
+        module_path, attr_name = _LAZY[name]
+        value = getattr(importlib.import_module(module_path), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = ["LLMRenderer", "LLMAdapter", "MockLLMAdapter", "OpenAIAdapter"]
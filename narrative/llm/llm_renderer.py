@@ -6,53 +6,16 @@ into natural language stories using large language models (LLMs).
 """
 # flake8: noqa: E501
 
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Union
 
 from narrative.core.trajectory_explorer import Trajectory
 
-
-class LLMAdapter(ABC):
-    """
-    Abstract base class for LLM adapters.
-
-    An LLM adapter is responsible for communicating with a
-    specific LLM API or service.
-    """
-
-    @abstractmethod
-    def generate(self, prompt: str) -> str:
-        """
-        Generate text from a prompt using an LLM.
-
-        Args:
-            prompt: The prompt to send to the LLM.
-
-        Returns:
-            The generated text.
-        """
-        pass
-
-
-class MockLLMAdapter(LLMAdapter):
-    """
-    A mock LLM adapter that returns a predefined response.
-
-    This adapter is useful for testing and development when you don't want to
-    make actual API calls to an LLM service.
-    """
-
-    def generate(self, prompt: str) -> str:
-        """
-        Generate text from a prompt using a mock LLM.
-
-        Args:
-            prompt: The prompt to send to the mock LLM.
-
-        Returns:
-            A predefined response.
-        """
-        return """
+# The canned story returned by MockLLMAdapter
+_MOCK_RESPONSE = """
 Once upon a time, there was a little girl named Little Red Riding Hood. She was called that because she always wore a red hooded cloak that her grandmother had made for her.
 
 One day, Little Red Riding Hood's mother asked her to take a basket of food to her grandmother, who lived in a cottage in the forest. The grandmother had been feeling ill, and the food would help her feel better.
@@ -129,6 +92,76 @@ And they all lived happily ever after.
 """
 
 
+class LLMAdapter(ABC):
+    """
+    Abstract base class for LLM adapters.
+
+    An LLM adapter is responsible for communicating with a
+    specific LLM API or service.
+    """
+
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """
+        Generate text from a prompt using an LLM.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+
+        Returns:
+            The generated text.
+        """
+        pass
+
+    def generate_many(self, prompts: List[str]) -> List[str]:
+        """
+        Generate text from several prompts using an LLM.
+
+        Adapters for remote services can override this to send the requests
+        concurrently. By default, the prompts are generated one at a time.
+
+        Args:
+            prompts: The prompts to send to the LLM.
+
+        Returns:
+            The generated texts, in the same order as the prompts.
+        """
+        return [self.generate(prompt) for prompt in prompts]
+
+
+class MockLLMAdapter(LLMAdapter):
+    """
+    A mock LLM adapter that returns a predefined response.
+
+    This adapter is useful for testing and development when you don't want to
+    make actual API calls to an LLM service.
+    """
+
+    def generate(self, prompt: str) -> str:
+        """
+        Generate text from a prompt using a mock LLM.
+
+        Args:
+            prompt: The prompt to send to the mock LLM.
+
+        Returns:
+            A predefined response.
+        """
+        return _MOCK_RESPONSE
+
+    def generate_many(self, prompts: List[str]) -> List[str]:
+        """
+        Generate text from several prompts using a mock LLM.
+
+        Args:
+            prompts: The prompts to send to the mock LLM.
+
+        Returns:
+            The predefined response once per prompt.
+        """
+        return [_MOCK_RESPONSE] * len(prompts)
+
+
 class OpenAIAdapter(LLMAdapter):
     """
     An adapter for the OpenAI API.
@@ -136,14 +169,23 @@ class OpenAIAdapter(LLMAdapter):
     This adapter uses the OpenAI API to generate text from prompts.
     """
 
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    def __init__(self, api_key: str, model: str = "gpt-4", max_concurrency: int = 8):
         """
         Initialize an OpenAIAdapter.
 
         Args:
             api_key: The OpenAI API key.
             model: The model to use (default: "gpt-4").
+            max_concurrency: The maximum number of requests that
+                ``generate_many`` has in flight at once (default: 8).
+
+        Raises:
+            ImportError: If openai is not installed.
+            ValueError: If max_concurrency is less than 1.
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         try:
             import openai
         except ImportError as err:
@@ -154,6 +196,7 @@ class OpenAIAdapter(LLMAdapter):
 
         self.client = openai.OpenAI(api_key=api_key)
         self.model = model
+        self.max_concurrency = max_concurrency
 
     def generate(self, prompt: str) -> str:
         """
@@ -165,16 +208,80 @@ class OpenAIAdapter(LLMAdapter):
         Returns:
             The generated text.
         """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+        response = self.client.chat.completions.create(**self._request(prompt))
+        return self._content(response)
+
+    def generate_many(self, prompts: List[str]) -> List[str]:
+        """
+        Generate text from several prompts with concurrent OpenAI API requests.
+
+        At most ``max_concurrency`` requests are sent at once. The requests
+        run on their own event loop. If this is called from a running event
+        loop, e.g. in Jupyter, that loop runs on a worker thread and the
+        call blocks until all requests have finished.
+
+        Args:
+            prompts: The prompts to send to the OpenAI API.
+
+        Returns:
+            The generated texts, in the same order as the prompts.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._generate_many(prompts))
+
+        # asyncio.run() cannot be nested in a running loop, so start a new
+        # one on a worker thread. The coroutine is created there as well, so
+        # it is never left un-awaited.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                lambda: asyncio.run(self._generate_many(prompts))
+            ).result()
+
+    async def _generate_many(self, prompts: List[str]) -> List[str]:
+        """Send the requests for several prompts concurrently."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # The async client is bound to the event loop, so use one per call
+        async with self._async_client() as client:
+
+            async def generate(prompt: str) -> str:
+                async with semaphore:
+                    response = await client.chat.completions.create(
+                        **self._request(prompt)
+                    )
+                return self._content(response)
+
+            return list(await asyncio.gather(*map(generate, prompts)))
+
+    def _async_client(self) -> Any:
+        """Create an async client with the same settings as ``self.client``."""
+        import openai
+
+        client = self.client
+        return openai.AsyncOpenAI(
+            api_key=client.api_key,
+            organization=client.organization,
+            base_url=client.base_url,
+            timeout=client.timeout,
+            max_retries=client.max_retries,
+        )
+
+    def _request(self, prompt: str) -> Dict[str, Any]:
+        """Get the chat completion request parameters for a prompt."""
+        return {
+            "model": self.model,
+            "messages": [
                 {"role": "system", "content": "You are a creative storyteller."},
                 {"role": "user", "content": prompt},
             ],
-            temperature=0.7,
-            max_tokens=2000,
-        )
+            "temperature": 0.7,
+            "max_tokens": 2000,
+        }
 
+    def _content(self, response: Any) -> str:
+        """Get the generated text from a chat completion response."""
         content = response.choices[0].message.content
         if content is None:
             return ""
@@ -188,20 +295,39 @@ class LLMRenderer:
     using LLMs.
     """
 
-    def __init__(self, adapter: Optional[LLMAdapter] = None):
+    def __init__(
+        self,
+        adapter: Optional[LLMAdapter] = None,
+        cache: Union[MutableMapping[str, str], bool, None] = None,
+    ):
         """
         Initialize an LLMRenderer.
 
         Args:
             adapter: The LLM adapter to use. If not provided, a MockLLMAdapter
                 will be used.
+            cache: Optional mapping used to cache LLM responses by adapter and
+                prompt. Any mutable mapping works, e.g. a ``shelve`` or
+                ``diskcache.Cache`` to share responses across runs. If not
+                provided, or True, responses are cached in memory. If False,
+                nothing is cached and every render calls the LLM.
         """
         self.adapter = adapter or MockLLMAdapter()
+        self.cache: Optional[MutableMapping[str, str]]
+        if cache is False:
+            self.cache = None
+        elif cache is None or cache is True:
+            self.cache = {}
+        else:
+            self.cache = cache
 
     def render(self, trajectory: Trajectory) -> str:
         """
         Render a trajectory into a natural language story.
 
+        Unless caching is disabled, identical prompts are only sent to the
+        LLM once; later renders reuse the cached response.
+
         Args:
             trajectory: The trajectory to render.
 
@@ -209,9 +335,71 @@ class LLMRenderer:
             A natural language story.
         """
         prompt = self._create_prompt(trajectory)
-        response = self.adapter.generate(prompt)
+        if self.cache is None:
+            return self._process_response(self.adapter.generate(prompt))
+
+        key = self._cache_key(prompt)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.adapter.generate(prompt)
+            self.cache[key] = response
         return self._process_response(response)
 
+    def render_many(self, trajectories: Iterable[Trajectory]) -> List[str]:
+        """
+        Render several trajectories into natural language stories.
+
+        All uncached prompts are passed to the adapter at once, so adapters
+        that support it can generate the stories concurrently.
+
+        Args:
+            trajectories: The trajectories to render.
+
+        Returns:
+            The natural language stories, in the same order as the trajectories.
+        """
+        prompts = [self._create_prompt(trajectory) for trajectory in trajectories]
+        if self.cache is None:
+            responses = self.adapter.generate_many(prompts)
+            return [self._process_response(response) for response in responses]
+
+        keys = [self._cache_key(prompt) for prompt in prompts]
+
+        # Generate each distinct uncached prompt once
+        missing = {
+            key: prompt
+            for key, prompt in zip(keys, prompts, strict=True)
+            if key not in self.cache
+        }
+        if missing:
+            responses = self.adapter.generate_many(list(missing.values()))
+            self.cache.update(zip(missing, responses, strict=True))
+
+        return [self._process_response(self.cache[key]) for key in keys]
+
+    def clear_cache(self) -> None:
+        """Remove all cached LLM responses."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Get the cache key for a prompt.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+
+        Returns:
+            The SHA-256 hex digest of the adapter's class, its model (if any),
+            and the prompt.
+        """
+        adapter_type = type(self.adapter)
+        model = getattr(self.adapter, "model", "")
+        key = (
+            f"{adapter_type.__module__}.{adapter_type.__qualname__}\0{model}\0{prompt}"
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
     def _create_prompt(self, trajectory: Trajectory) -> str:
         """
         Create a prompt for the LLM from a trajectory.
@@ -222,30 +410,32 @@ class LLMRenderer:
         Returns:
             A prompt for the LLM.
         """
-        prompt = (
+        # Collect the fragments and join them once, rather than copying the
+        # growing prompt for every intention
+        parts = [
             "Create a coherent and engaging story based on the following "
             "sequence of intentions:\n\n"
-        )
+        ]
 
         for i, intention in enumerate(trajectory.intentions):
-            prompt += (
+            parts.append(
                 f"{i+1}. {intention['character']} intends to {intention['id']} "
                 f"{intention['target']} at {intention['location']}"
             )
 
             if intention.get("description"):
-                prompt += f" {intention['description']}"
+                parts.append(f" {intention['description']}")
 
-            prompt += "\n"
+            parts.append("\n")
 
-        prompt += (
+        parts.append(
             "\nThe story should follow this sequence of intentions, but feel free "
             "to add details, dialogue, and descriptions to make it engaging. "
             "The story should be coherent and flow naturally from one intention "
             "to the next."
         )
 
-        return prompt
+        return "".join(parts)
 
     def _process_response(self, response: str) -> str:
         """
@@ -4,6 +4,33 @@ Schemas Package
 This package contains the schema definitions for the Narrative library.
 """
 
-from narrative.schemas.domain import Dependency, Domain, Intention
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from narrative.schemas.domain import Dependency, Domain, Intention
+
+# Submodules are imported lazily on first access (PEP 562)
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "Domain": ("narrative.schemas.domain", "Domain"),
+    "Intention": ("narrative.schemas.domain", "Intention"),
+    "Dependency": ("narrative.schemas.domain", "Dependency"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import schema classes on first access."""
+    if name in _LAZY:
+        module_path, attr_name = _LAZY[name]
+        value = getattr(importlib.import_module(module_path), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = ["Domain", "Intention", "Dependency"]
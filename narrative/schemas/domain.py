@@ -6,9 +6,9 @@ A domain consists of characters, locations, intentions, and dependencies between
 """
 # flake8: noqa: E501
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel
 
 
 class Intention(BaseModel):
@@ -31,6 +31,10 @@ class Intention(BaseModel):
     description: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    model_config = {
+        "frozen": True,
+    }
+
 
 class Dependency(BaseModel):
     """
@@ -50,6 +54,10 @@ class Dependency(BaseModel):
     description: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    model_config = {
+        "frozen": True,
+    }
+
 
 class Domain(BaseModel):
     """
@@ -67,28 +75,13 @@ class Domain(BaseModel):
 
     characters: List[str]
     locations: List[str]
-    intentions: List[Union[Intention, Dict[str, Any]]]
-    dependencies: List[Union[Dependency, Dict[str, Any]]]
+    # Dicts are parsed into Intention and Dependency objects by pydantic-core
+    intentions: List[Intention]
+    dependencies: List[Dependency]
     name: Optional[str] = None
     description: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
-    @classmethod
-    @field_validator("intentions")
-    def validate_intentions(cls, v: Any) -> Union[Intention, Any]:
-        """Validate and convert intentions to Intention objects."""
-        if isinstance(v, dict):
-            return Intention(**v)
-        return v
-
-    @classmethod
-    @field_validator("dependencies")
-    def validate_dependencies(cls, v: Any) -> Union[Dependency, Any]:
-        """Validate and convert dependencies to Dependency objects."""
-        if isinstance(v, dict):
-            return Dependency(**v)
-        return v
-
     model_config = {
         "arbitrary_types_allowed": True,
     }
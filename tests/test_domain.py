@@ -0,0 +1,115 @@
+"""
+Tests for the Domain schema.
+
+This module contains tests for the Domain model, which validates the
+characters, locations, intentions, and dependencies of a narrative world.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from narrative.schemas.domain import Dependency, Domain, Intention
+
+
+def test_domain_parses_dicts():
+    """Test that dict intentions and dependencies are parsed into models."""
+    domain = Domain(
+        characters=["little_red", "grandmother"],
+        locations=["cottage"],
+        intentions=[
+            {
+                "id": "visit_grandmother",
+                "character": "little_red",
+                "target": "grandmother",
+                "location": "cottage",
+            },
+            Intention(
+                id="deliver_basket",
+                character="little_red",
+                target="grandmother",
+                location="cottage",
+            ),
+        ],
+        dependencies=[
+            {
+                "from_intention": "deliver_basket",
+                "to_intention": "visit_grandmother",
+                "type": "intentional",
+            }
+        ],
+    )
+
+    assert all(isinstance(i, Intention) for i in domain.intentions)
+    assert all(isinstance(d, Dependency) for d in domain.dependencies)
+    assert domain.intentions[0].id == "visit_grandmother"
+
+
+def test_domain_rejects_invalid_dicts():
+    """Test that invalid dict intentions and dependencies are rejected."""
+    with pytest.raises(ValidationError):
+        Domain(
+            characters=["little_red"],
+            locations=["cottage"],
+            intentions=[{"id": "visit_grandmother", "character": "little_red"}],
+            dependencies=[],
+        )
+
+    with pytest.raises(ValidationError):
+        Domain(
+            characters=["little_red"],
+            locations=["cottage"],
+            intentions=[],
+            dependencies=[
+                {
+                    "from_intention": "deliver_basket",
+                    "to_intention": "visit_grandmother",
+                    "type": "unknown",
+                }
+            ],
+        )
+
+
+def test_intentions_and_dependencies_are_frozen():
+    """Test that intentions and dependencies cannot be modified in place."""
+    intention = Intention(
+        id="visit_grandmother",
+        character="little_red",
+        target="grandmother",
+        location="cottage",
+    )
+    dependency = Dependency(
+        from_intention="deliver_basket",
+        to_intention="visit_grandmother",
+        type="intentional",
+    )
+
+    with pytest.raises(ValidationError):
+        intention.location = "forest"
+    with pytest.raises(ValidationError):
+        dependency.type = "motivational"
+
+    # Frozen models are hashable
+    assert len({intention, intention.model_copy()}) == 1
+
+
+def test_domain_json_round_trip():
+    """Test that a domain can be parsed directly from its JSON form."""
+    domain = Domain(
+        characters=["little_red", "grandmother"],
+        locations=["cottage"],
+        intentions=[
+            {
+                "id": "visit_grandmother",
+                "character": "little_red",
+                "target": "grandmother",
+                "location": "cottage",
+                "metadata": {"time": "morning"},
+            }
+        ],
+        dependencies=[],
+        name="Little Red Riding Hood",
+    )
+
+    loaded_domain = Domain.model_validate_json(domain.model_dump_json())
+    assert loaded_domain == domain
+    assert isinstance(loaded_domain.intentions[0], Intention)
@@ -6,8 +6,12 @@ This module contains tests for the IDGBuilder class,
 from a domain.
 """
 
+import networkx as nx
+import pytest
+
 from narrative.core.idg_builder import IDG, IDGBuilder
-from narrative.schemas.domain import Domain
+from narrative.core.trajectory_explorer import TrajectoryExplorer
+from narrative.schemas.domain import Domain, Intention
 
 
 def test_idg_builder_initialization():
@@ -69,92 +73,58 @@ def test_idg_builder_build():
     assert ("deliver_basket", "visit_grandmother") in idg.edges
 
 
-def test_idg_builder_validate():
-    """Test that the IDGBuilder can validate a domain."""
-    # Valid domain
-    domain = Domain(
-        characters=["little_red", "wolf", "grandmother", "hunter"],
-        locations=["forest", "cottage", "village"],
-        intentions=[
-            {
-                "id": "visit_grandmother",
-                "character": "little_red",
-                "target": "grandmother",
-                "location": "cottage",
-            }
-        ],
-        dependencies=[],
-    )
-
-    builder = IDGBuilder(domain)
-    errors = builder.validate()
-    assert len(errors) == 0
-
-    # Invalid domain with non-existent character
-    domain = Domain(
+def _validation_domain(character="little_red", location="cottage", dependencies=()):
+    """Create a domain with a single intention for validation tests."""
+    return Domain(
         characters=["little_red", "wolf", "grandmother", "hunter"],
         locations=["forest", "cottage", "village"],
         intentions=[
             {
                 "id": "visit_grandmother",
-                "character": "non_existent_character",
+                "character": character,
                 "target": "grandmother",
-                "location": "cottage",
+                "location": location,
             }
         ],
-        dependencies=[],
+        dependencies=list(dependencies),
     )
 
-    builder = IDGBuilder(domain)
-    errors = builder.validate()
-    assert len(errors) == 1
-    assert "non_existent_character" in errors[0]
 
-    # Invalid domain with non-existent location
-    domain = Domain(
-        characters=["little_red", "wolf", "grandmother", "hunter"],
-        locations=["forest", "cottage", "village"],
-        intentions=[
+@pytest.mark.parametrize(
+    "domain_kwargs, expected_error",
+    [
+        # Valid domain
+        ({}, None),
+        # Invalid domain with non-existent character
+        ({"character": "non_existent_character"}, "non_existent_character"),
+        # Invalid domain with non-existent location
+        ({"location": "non_existent_location"}, "non_existent_location"),
+        # Invalid domain with non-existent intention in dependency
+        (
             {
-                "id": "visit_grandmother",
-                "character": "little_red",
-                "target": "grandmother",
-                "location": "non_existent_location",
-            }
-        ],
-        dependencies=[],
-    )
-
-    builder = IDGBuilder(domain)
+                "dependencies": [
+                    {
+                        "from_intention": "non_existent_intention",
+                        "to_intention": "visit_grandmother",
+                        "type": "intentional",
+                    }
+                ]
+            },
+            "non_existent_intention",
+        ),
+    ],
+    ids=["valid", "character", "location", "dependency"],
+)
+def test_idg_builder_validate(domain_kwargs, expected_error):
+    """Test that the IDGBuilder can validate a domain."""
+    builder = IDGBuilder(_validation_domain(**domain_kwargs))
     errors = builder.validate()
-    assert len(errors) == 1
-    assert "non_existent_location" in errors[0]
-
-    # Invalid domain with non-existent intention in dependency
-    domain = Domain(
-        characters=["little_red", "wolf", "grandmother", "hunter"],
-        locations=["forest", "cottage", "village"],
-        intentions=[
-            {
-                "id": "visit_grandmother",
-                "character": "little_red",
-                "target": "grandmother",
-                "location": "cottage",
-            }
-        ],
-        dependencies=[
-            {
-                "from_intention": "non_existent_intention",
-                "to_intention": "visit_grandmother",
-                "type": "intentional",
-            }
-        ],
-    )
 
-    builder = IDGBuilder(domain)
-    errors = builder.validate()
-    assert len(errors) == 1
-    assert "non_existent_intention" in errors[0]
+    if expected_error is None:
+        assert len(errors) == 0
+    else:
+        assert len(errors) == 1
+        assert expected_error in errors[0]
 
 
 def test_idg_methods():
@@ -219,3 +189,212 @@ def test_idg_methods():
     # Test get_dependency_data
     dependency_data = idg.get_dependency_data("deliver_basket", "visit_grandmother")
     assert dependency_data["type"] == "intentional"
+
+
+def test_idg_root_and_leaf_cache_invalidation():
+    """Test that cached root and leaf intentions follow graph mutations."""
+    idg = IDG()
+    idg.add_edge("deliver_basket", "visit_grandmother", type="intentional")
+    assert idg.get_root_intentions() == {"deliver_basket"}
+    assert idg.get_leaf_intentions() == {"visit_grandmother"}
+
+    idg.add_edge("eat_little_red", "deliver_basket", type="motivational")
+    assert idg.get_root_intentions() == {"eat_little_red"}
+
+    idg.add_node("kill_wolf")
+    assert "kill_wolf" in idg.get_root_intentions()
+    assert "kill_wolf" in idg.get_leaf_intentions()
+
+    idg.remove_edge("deliver_basket", "visit_grandmother")
+    assert idg.get_leaf_intentions() == {
+        "deliver_basket",
+        "visit_grandmother",
+        "kill_wolf",
+    }
+
+    # The cached sets are returned directly and cannot be modified
+    assert idg.get_root_intentions() is idg.get_root_intentions()
+    assert isinstance(idg.get_root_intentions(), frozenset)
+
+    idg.clear()
+    assert idg.get_root_intentions() == set()
+
+
+def test_idg_views_follow_graph_changes():
+    """Test that root and leaf sets of graph views reflect the parent graph."""
+    idg = IDG()
+    idg.add_edge("deliver_basket", "visit_grandmother", type="intentional")
+    subgraph = idg.subgraph(["deliver_basket", "visit_grandmother"])
+    reverse = idg.reverse(copy=False)
+    assert subgraph.get_root_intentions() == {"deliver_basket"}
+    assert reverse.get_leaf_intentions() == {"deliver_basket"}
+
+    idg.remove_edge("deliver_basket", "visit_grandmother")
+    assert subgraph.get_root_intentions() == {"deliver_basket", "visit_grandmother"}
+    assert subgraph.get_leaf_intentions() == {"deliver_basket", "visit_grandmother"}
+    assert reverse.get_leaf_intentions() == {"deliver_basket", "visit_grandmother"}
+
+
+def test_explorer_on_idg_view_follows_graph_changes():
+    """Test that the CSR snapshot of a graph view reflects the parent graph."""
+    idg = IDG()
+    idg.add_edge("deliver_basket", "visit_grandmother", type="intentional")
+    subgraph = idg.subgraph(["deliver_basket", "visit_grandmother"])
+    explorer = TrajectoryExplorer(subgraph)
+    assert len(explorer.get_trajectories()) == 2
+
+    idg.remove_edge("deliver_basket", "visit_grandmother")
+    assert len(subgraph.successors_fast("deliver_basket")) == 0
+    assert len(explorer.get_trajectories()) == 2
+    assert all(len(t.intentions) == 1 for t in explorer.get_trajectories())
+
+
+def test_idg_csr_adjacency():
+    """Test the compact array representation of the IDG."""
+    idg = IDG()
+    idg.add_node("visit_grandmother", character="little_red", location="cottage")
+    idg.add_edge("deliver_basket", "visit_grandmother", type="intentional")
+    idg.add_edge("eat_little_red", "visit_grandmother", type="motivational")
+
+    csr = idg.csr()
+    assert csr.node_ids == ["visit_grandmother", "deliver_basket", "eat_little_red"]
+    assert [csr.node_ids[i] for i in idg.successors_fast("deliver_basket")] == [
+        "visit_grandmother"
+    ]
+    assert sorted(
+        csr.node_ids[i] for i in idg.predecessors_fast("visit_grandmother")
+    ) == ["deliver_basket", "eat_little_red"]
+    assert len(idg.successors_fast("visit_grandmother")) == 0
+
+    # Mutations rebuild the representation
+    idg.add_edge("visit_grandmother", "kill_wolf", type="motivational")
+    assert idg.csr() is not csr
+    assert len(idg.successors_fast("visit_grandmother")) == 1
+
+    # Finalized graphs are frozen
+    assert idg.finalize() is idg
+    with pytest.raises(nx.NetworkXError):
+        idg.add_node("rescue_little_red")
+
+
+def test_idg_builder_domain_reassignment():
+    """Test that reassigning the builder's domain refreshes cached intentions."""
+    domain = Domain(
+        characters=["little_red", "grandmother"],
+        locations=["cottage"],
+        intentions=[
+            {
+                "id": "visit_grandmother",
+                "character": "little_red",
+                "target": "grandmother",
+                "location": "cottage",
+            }
+        ],
+        dependencies=[],
+    )
+    builder = IDGBuilder(domain)
+    assert builder.validate() == []
+    assert set(builder.build().nodes) == {"visit_grandmother"}
+
+    # Repeated builds of the same domain return the cached IDG, which is
+    # frozen so that no caller can change it for the others
+    idg = builder.build()
+    assert builder.build() is idg
+    with pytest.raises(nx.NetworkXError):
+        idg.add_node("deliver_basket")
+    assert set(builder.build().nodes) == {"visit_grandmother"}
+    copied = idg.copy()
+    assert isinstance(copied, IDG)
+    copied.add_node("deliver_basket")
+
+    # In-place changes to the domain's lists are picked up
+    domain.intentions.append(
+        Intention(
+            id="deliver_basket",
+            character="little_red",
+            target="grandmother",
+            location="forest",
+        )
+    )
+    assert set(builder.build().nodes) == {"visit_grandmother", "deliver_basket"}
+    assert builder.validate() == ["Location 'forest' missing (id: deliver_basket)."]
+    domain.locations.append("forest")
+    assert builder.validate() == []
+
+    builder.domain = Domain(
+        characters=["little_red", "grandmother"],
+        locations=["cottage"],
+        intentions=[
+            {
+                "id": "deliver_basket",
+                "character": "little_red",
+                "target": "grandmother",
+                "location": "cottage",
+            }
+        ],
+        dependencies=[],
+    )
+    assert set(builder.build().nodes) == {"deliver_basket"}
+
+
+def test_idg_data_is_read_only():
+    """Test that intention and dependency data are returned as read-only views."""
+    idg = IDG()
+    idg.add_edge("deliver_basket", "visit_grandmother", type="intentional")
+    idg.nodes["visit_grandmother"]["character"] = "little_red"
+
+    intention_data = idg.get_intention_data("visit_grandmother")
+    with pytest.raises(TypeError):
+        intention_data["character"] = "wolf"
+    assert dict(intention_data) == {"character": "little_red"}
+
+    dependency_data = idg.get_dependency_data("deliver_basket", "visit_grandmother")
+    with pytest.raises(TypeError):
+        dependency_data["type"] = "motivational"
+    assert dependency_data["type"] == "intentional"
+
+
+def test_idg_layered_layout():
+    """Test the layered layout used for visualization."""
+    idg = IDG()
+    idg.add_edge("deliver_basket", "visit_grandmother", type="intentional")
+    idg.add_edge("eat_little_red", "visit_grandmother", type="motivational")
+
+    pos = idg._layout_positions("layered")
+    assert set(pos) == set(idg.nodes)
+    assert pos["deliver_basket"][0] == pos["eat_little_red"][0] == 0.0
+    assert pos["visit_grandmother"][0] == 1.0
+
+    with pytest.raises(ValueError):
+        idg._layout_positions("unknown")
+
+
+def test_idg_builder_interns_strings():
+    """Test that equal intention attribute strings share one object."""
+    # Build equal strings at runtime so that they start as distinct objects
+    little_red = "".join(["little_", "red"])
+    domain = Domain(
+        characters=["little_red", "grandmother"],
+        locations=["cottage"],
+        intentions=[
+            {
+                "id": "visit_grandmother",
+                "character": "little_red",
+                "target": "grandmother",
+                "location": "cottage",
+            },
+            {
+                "id": "deliver_basket",
+                "character": little_red,
+                "target": "grandmother",
+                "location": "".join(["cott", "age"]),
+            },
+        ],
+        dependencies=[],
+    )
+    idg = IDGBuilder(domain).build()
+
+    visit = idg.get_intention_data("visit_grandmother")
+    deliver = idg.get_intention_data("deliver_basket")
+    assert visit["character"] is deliver["character"]
+    assert visit["location"] is deliver["location"]
@@ -6,13 +6,71 @@ into natural language stories using large language models (LLMs).
 """
 # flake8: noqa: E501
 
-from unittest.mock import MagicMock
-
 # mypy: ignore-errors
+import asyncio
+import sys
+from types import ModuleType, SimpleNamespace
+
 import pytest
 
 from narrative.core.trajectory_explorer import Trajectory
-from narrative.llm.llm_renderer import LLMAdapter, LLMRenderer, MockLLMAdapter
+from narrative.llm.llm_renderer import (
+    LLMAdapter,
+    LLMRenderer,
+    MockLLMAdapter,
+    OpenAIAdapter,
+)
+
+
+class RecordingAdapter(LLMAdapter):
+    """An LLM adapter that records its prompts and returns a fixed response."""
+
+    def __init__(self, response="This is a test story."):
+        self.response = response
+        self.calls = []
+
+    def generate(self, prompt):
+        self.calls.append(prompt)
+        return self.response
+
+
+class FakeOpenAI:
+    """A stand-in for openai.OpenAI that only holds its settings."""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.organization = "org-test"
+        self.base_url = "https://llm.example/v1"
+        self.timeout = 30.0
+        self.max_retries = 5
+
+
+class FakeAsyncOpenAI:
+    """A stand-in for openai.AsyncOpenAI that echoes prompts concurrently."""
+
+    instances = []
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        FakeAsyncOpenAI.instances.append(self)
+
+    async def create(self, model, messages, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        message = SimpleNamespace(content=f"story: {messages[-1]['content']}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
 
 
 @pytest.fixture
@@ -44,10 +102,8 @@ def simple_trajectory():
 
 @pytest.fixture
 def mock_adapter():
-    """Create a mock LLM adapter for testing."""
-    adapter = MagicMock(spec=LLMAdapter)
-    adapter.generate.return_value = "This is a test story."
-    return adapter
+    """Create a recording LLM adapter for testing."""
+    return RecordingAdapter()
 
 
 def test_llm_renderer_initialization():
@@ -57,7 +113,7 @@ def test_llm_renderer_initialization():
     assert isinstance(renderer.adapter, MockLLMAdapter)
 
     # Test with custom adapter
-    mock_adapter = MagicMock(spec=LLMAdapter)
+    mock_adapter = RecordingAdapter()
     renderer = LLMRenderer(adapter=mock_adapter)
     assert renderer.adapter == mock_adapter
 
@@ -68,8 +124,8 @@ def test_llm_renderer_render(simple_trajectory, mock_adapter):
     story = renderer.render(simple_trajectory)
 
     # Check that the adapter was called with a prompt
-    mock_adapter.generate.assert_called_once()
-    prompt = mock_adapter.generate.call_args[0][0]
+    assert len(mock_adapter.calls) == 1
+    prompt = mock_adapter.calls[0]
     assert isinstance(prompt, str)
     assert "little_red" in prompt
     assert "wolf" in prompt
@@ -129,7 +185,7 @@ def test_llm_renderer_with_description(mock_adapter):
     renderer.render(trajectory)
 
     # Check that the adapter was called with a prompt containing the description
-    prompt = mock_adapter.generate.call_args[0][0]
+    prompt = mock_adapter.calls[-1]
     assert "to bring her food" in prompt
 
 
@@ -152,5 +208,138 @@ def test_llm_renderer_with_metadata(mock_adapter):
 
     # Check that the adapter was called with a prompt
     # (metadata is not included in the prompt by default)
-    prompt = mock_adapter.generate.call_args[0][0]
+    prompt = mock_adapter.calls[-1]
     assert "visit_grandmother" in prompt
+
+
+def test_llm_renderer_render_many(simple_trajectory):
+    """Test that the LLMRenderer can render several trajectories at once."""
+
+    class EchoAdapter(LLMAdapter):
+        def generate(self, prompt):
+            return prompt.splitlines()[2]
+
+    renderer = LLMRenderer(adapter=EchoAdapter())
+    trajectories = [
+        simple_trajectory,
+        Trajectory(intentions=simple_trajectory.intentions[2:]),
+    ]
+    stories = renderer.render_many(trajectories)
+
+    # The stories are returned in the same order as the trajectories
+    assert stories == [renderer.render(trajectory) for trajectory in trajectories]
+    assert stories[1] == "1. wolf intends to eat_little_red little_red at forest"
+
+
+def test_llm_renderer_cache(simple_trajectory, mock_adapter):
+    """Test that the LLMRenderer only sends each prompt to the LLM once."""
+    renderer = LLMRenderer(adapter=mock_adapter)
+    assert renderer.render(simple_trajectory) == "This is a test story."
+    assert renderer.render(simple_trajectory) == "This is a test story."
+    assert len(mock_adapter.calls) == 1
+
+    # Batched renders reuse cached responses and deduplicate prompts
+    other_trajectory = Trajectory(intentions=simple_trajectory.intentions[:1])
+    mock_adapter.response = "Another test story."
+    stories = renderer.render_many(
+        [simple_trajectory, other_trajectory, other_trajectory]
+    )
+    assert stories == [
+        "This is a test story.",
+        "Another test story.",
+        "Another test story.",
+    ]
+    assert len(mock_adapter.calls) == 2
+
+    renderer.clear_cache()
+    renderer.render(simple_trajectory)
+    assert len(mock_adapter.calls) == 3
+
+
+def test_llm_renderer_custom_cache(simple_trajectory, mock_adapter):
+    """Test that the LLMRenderer stores responses in a provided cache."""
+    cache = {}
+    LLMRenderer(adapter=mock_adapter, cache=cache).render(simple_trajectory)
+
+    # A new renderer sharing the cache does not call the LLM again
+    renderer = LLMRenderer(adapter=mock_adapter, cache=cache)
+    assert renderer.render(simple_trajectory) == "This is a test story."
+    assert len(mock_adapter.calls) == 1
+    assert list(cache.values()) == ["This is a test story."]
+
+    # A different adapter does not reuse the cached response
+    class OtherAdapter(RecordingAdapter):
+        pass
+
+    renderer.adapter = OtherAdapter(response="Another test story.")
+    assert renderer.render(simple_trajectory) == "Another test story."
+    assert len(cache) == 2
+
+
+def test_llm_renderer_without_cache(simple_trajectory, mock_adapter):
+    """Test that the LLMRenderer calls the LLM every time if caching is off."""
+    renderer = LLMRenderer(adapter=mock_adapter, cache=False)
+    assert renderer.cache is None
+    renderer.render(simple_trajectory)
+    renderer.render(simple_trajectory)
+    assert len(mock_adapter.calls) == 2
+
+    stories = renderer.render_many([simple_trajectory, simple_trajectory])
+    assert stories == ["This is a test story.", "This is a test story."]
+    assert len(mock_adapter.calls) == 4
+
+    renderer.clear_cache()
+
+
+def test_openai_adapter_generate_many(monkeypatch):
+    """Test that the OpenAI adapter sends a bounded number of requests at once."""
+    openai = ModuleType("openai")
+    openai.OpenAI = FakeOpenAI
+    openai.AsyncOpenAI = FakeAsyncOpenAI
+    monkeypatch.setitem(sys.modules, "openai", openai)
+    monkeypatch.setattr(FakeAsyncOpenAI, "instances", [])
+
+    adapter = OpenAIAdapter(api_key="test-key", max_concurrency=2)
+    prompts = [f"prompt {i}" for i in range(5)]
+    assert adapter.generate_many(prompts) == [f"story: {p}" for p in prompts]
+
+    (client,) = FakeAsyncOpenAI.instances
+    assert client.settings == {
+        "api_key": "test-key",
+        "organization": "org-test",
+        "base_url": "https://llm.example/v1",
+        "timeout": 30.0,
+        "max_retries": 5,
+    }
+    assert client.max_in_flight == 2
+    assert client.closed
+
+    with pytest.raises(ValueError):
+        OpenAIAdapter(api_key="test-key", max_concurrency=0)
+
+
+def test_openai_adapter_generate_many_in_running_loop(monkeypatch):
+    """Test that the OpenAI adapter can be used from a running event loop."""
+    openai = ModuleType("openai")
+    openai.OpenAI = FakeOpenAI
+    openai.AsyncOpenAI = FakeAsyncOpenAI
+    monkeypatch.setitem(sys.modules, "openai", openai)
+
+    adapter = OpenAIAdapter(api_key="test-key")
+    renderer = LLMRenderer(adapter=adapter)
+    trajectory = Trajectory(
+        intentions=[
+            {
+                "id": "visit_grandmother",
+                "character": "little_red",
+                "target": "grandmother",
+                "location": "cottage",
+            }
+        ]
+    )
+
+    async def render():
+        return renderer.render_many([trajectory])
+
+    (story,) = asyncio.run(render())
+    assert story.startswith("story: ")
@@ -7,12 +7,17 @@ trajectories through an Intention Dependency Graph (IDG).
 # flake8: noqa: E501
 
 # mypy: ignore-errors
+import copy
+import json
+from dataclasses import asdict
+
 import pytest
 
-from narrative.core.idg_builder import IDGBuilder
+from narrative.core.idg_builder import IDG, IDGBuilder
 from narrative.core.trajectory_explorer import (
     CoherenceMetric,
     DramaMetric,
+    IntentionTable,
     NoveltyMetric,
     Trajectory,
     TrajectoryExplorer,
@@ -20,7 +25,9 @@ from narrative.core.trajectory_explorer import (
 from narrative.schemas.domain import Domain
 
 
-@pytest.fixture
+# The domain, IDG, and explorer are not modified by the tests, so they are
+# built once and shared
+@pytest.fixture(scope="session")
 def simple_domain():
     """Create a simple domain for testing."""
     return Domain(
@@ -110,14 +117,14 @@ def simple_domain():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_idg(simple_domain):
     """Create a simple IDG for testing."""
     builder = IDGBuilder(simple_domain)
     return builder.build()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def explorer(simple_idg):
     """Create a TrajectoryExplorer for testing."""
     return TrajectoryExplorer(simple_idg)
@@ -227,8 +234,10 @@ def test_rank_trajectories_custom_metric(explorer):
         )
 
 
-def test_add_metric(explorer):
+def test_add_metric(simple_idg):
     """Test that the TrajectoryExplorer can add a custom metric."""
+    # Use a fresh explorer so the metric does not leak into other tests
+    explorer = TrajectoryExplorer(simple_idg)
 
     class CustomMetric:
         def score(self, trajectory):
@@ -264,3 +273,173 @@ def test_get_random_trajectory_with_start_intentions(explorer):
     assert isinstance(trajectory, Trajectory)
     assert len(trajectory.intentions) <= 3
     assert trajectory.intentions[0]["id"] == "visit_grandmother"
+
+
+@pytest.mark.parametrize("metric", ["novelty", "coherence", "drama"])
+def test_get_top_trajectories(explorer, metric):
+    """Test that the top trajectories match a full ranking."""
+    trajectories = explorer.get_trajectories(max_length=3)
+    ranked_trajectories = explorer.rank_trajectories(trajectories, metric=metric)
+
+    for k in (1, 3, len(trajectories) + 1):
+        top_trajectories = explorer.get_top_trajectories(k, metric=metric, max_length=3)
+        assert top_trajectories == ranked_trajectories[:k]
+
+
+def test_get_top_trajectories_custom_metric(explorer):
+    """Test that the top trajectories can be ranked by a metric without bounds."""
+
+    class CustomMetric:
+        def score(self, trajectory):
+            return len(trajectory.intentions)
+
+    top_trajectories = explorer.get_top_trajectories(
+        2, metric=CustomMetric(), max_length=3
+    )
+    assert [len(t.intentions) for t in top_trajectories] == [3, 3]
+
+    with pytest.raises(ValueError):
+        explorer.get_top_trajectories(2, metric="unknown")
+
+
+def test_metrics_follow_modified_trajectories(explorer):
+    """Test that metrics score the current intentions of a modified trajectory."""
+    trajectory = explorer.get_trajectories(
+        max_length=2, start_intentions=["kill_wolf"]
+    )[-1]
+    original_score = CoherenceMetric().score(trajectory)
+
+    # Swap in an intention that breaks character and location continuity
+    trajectory.intentions[-1] = {
+        "id": "walk_home",
+        "character": "grandmother",
+        "target": "grandmother",
+        "location": "village",
+    }
+    assert CoherenceMetric().score(trajectory) == 0.0
+    assert CoherenceMetric().score(trajectory) < original_score
+
+
+def test_trajectory_intentions_are_independent(explorer):
+    """Test that editing a trajectory's intentions does not leak into others."""
+    trajectories = explorer.get_trajectories(max_length=2)
+    trajectory = trajectories[-1]
+    trajectory.intentions[-1]["location"] = "nowhere"
+
+    # Trajectories only share intention dicts with their own extensions, and
+    # every call creates new ones
+    for other in trajectories[:-1] + explorer.get_trajectories(max_length=2):
+        assert all(intention["location"] != "nowhere" for intention in other.intentions)
+
+    assert copy.deepcopy(trajectory) == trajectory
+    assert json.loads(json.dumps(asdict(trajectory))) == asdict(trajectory)
+
+
+def test_explorer_follows_node_attribute_changes():
+    """Test that node attributes edited in place are seen by the explorer."""
+    idg = IDG()
+    idg.add_node("enter_forest", character="little_red", target="wolf", location="x")
+    idg.add_node("walk", character="little_red", target="wolf", location="x")
+    idg.add_node("run", character="little_red", target="wolf", location="x")
+    idg.add_edge("enter_forest", "walk", type="intentional")
+    idg.add_edge("enter_forest", "run", type="intentional")
+    explorer = TrajectoryExplorer(idg)
+    top_trajectories = explorer.get_top_trajectories(2, metric="coherence")
+    assert top_trajectories[-1].key() == ("enter_forest", "walk")
+
+    idg.nodes["walk"]["location"] = "y"
+    trajectory = explorer.get_trajectories(max_length=2)[1]
+    assert trajectory.intentions[-1]["location"] == "y"
+    assert CoherenceMetric().score(trajectory) == 0.5
+
+    top_trajectories = explorer.get_top_trajectories(2, metric="coherence")
+    assert top_trajectories[-1].key() == ("enter_forest", "run")
+
+
+def test_explorer_accepts_non_string_intention_ids():
+    """Test that non-string intention IDs only matter to the drama metric."""
+    idg = IDG()
+    idg.add_node(1, character="little_red", target="grandmother", location="forest")
+    idg.add_node(2, character="little_red", target="wolf", location="forest")
+    idg.add_edge(1, 2, type="intentional")
+    explorer = TrajectoryExplorer(idg)
+
+    assert [t.key() for t in explorer.get_trajectories()] == [(1,), (1, 2)]
+    top_trajectories = explorer.get_top_trajectories(2, metric="coherence")
+    assert [t.key() for t in top_trajectories] == [(1,), (1, 2)]
+
+    # Drama matches keywords in the IDs, which must be strings
+    with pytest.raises(TypeError):
+        explorer.get_top_trajectories(1, metric="drama")
+
+
+def test_drama_prefers_emotional_id_over_description():
+    """Test that an emotional intention ID outweighs an emotional description."""
+    trajectory = Trajectory(
+        intentions=[
+            {
+                "id": "love_grandmother",
+                "character": "little_red",
+                "target": "little_red",
+                "location": "cottage",
+                "description": "in anger",
+            }
+        ]
+    )
+
+    # No conflict, one character over one intention, full emotional intensity
+    assert DramaMetric().score(trajectory) == pytest.approx((0.0 + 0.5 + 1.0) / 3)
+
+
+@pytest.mark.parametrize("metric", ["novelty", "coherence", "drama"])
+def test_incremental_metric_state(explorer, metric):
+    """Test that incremental metric states score like whole trajectories."""
+    metric_obj = explorer.metrics[metric]
+    table = IntentionTable(explorer.idg)
+
+    for trajectory in explorer.get_trajectories(max_length=4):
+        state = None
+        for row in map(table.index.__getitem__, trajectory.key()):
+            state = metric_obj.update(state, table, row)
+
+        assert metric_obj.score_state(state) == metric_obj.score(trajectory)
+        assert metric_obj.upper_bound_state(state, 2) == metric_obj.upper_bound(
+            trajectory, 2
+        )
+
+
+def test_iter_trajectories(explorer):
+    """Test that iterating trajectories matches generating them."""
+    assert list(explorer.iter_trajectories(max_length=3)) == (
+        explorer.get_trajectories(max_length=3)
+    )
+
+
+def test_rank_trajectories_top_k(explorer):
+    """Test ranking a stream of trajectories down to the top k."""
+    trajectories = explorer.get_trajectories(max_length=3)
+    ranked_trajectories = explorer.rank_trajectories(
+        explorer.iter_trajectories(max_length=3), metric="drama", k=2
+    )
+
+    assert (
+        ranked_trajectories
+        == explorer.rank_trajectories(trajectories, metric="drama")[:2]
+    )
+
+
+def test_duplicate_trajectories_are_removed(explorer):
+    """Test that duplicate trajectories are not generated or ranked twice."""
+    trajectories = explorer.get_trajectories(
+        max_length=2, start_intentions=["kill_wolf", "kill_wolf"]
+    )
+    keys = [trajectory.key() for trajectory in trajectories]
+    assert keys[0] == ("kill_wolf",)
+    assert len(keys) == len(set(keys))
+
+    ranked_trajectories = explorer.rank_trajectories(
+        trajectories + trajectories, metric="drama", unique=True
+    )
+    assert ranked_trajectories == explorer.rank_trajectories(
+        trajectories, metric="drama"
+    )